@@ -1,7 +1,7 @@
-import asyncio
+from enum import IntFlag, auto
 import math
-from typing import Callable, Iterable, Optional, TypeIs
-from pygame import Surface
+from typing import Any, Callable, Iterable, Iterator, Optional
+from pygame import Rect, Surface
 from pygame.event import Event
 from pygame.mixer import Sound
 
@@ -12,163 +12,235 @@ from pygame.mixer import Sound
 
 
 class Action:
-    __ActionSet: 'type[__ActionSet]'
-    __AddActor: 'type[__AddActor]'
-    __DecreaseLives: 'type[__DecreaseLives]'
-    __ForEach: 'type[__ForEach]'
-    __IncrScore: 'type[__IncrScore]'
-    __PlayAudio: 'type[__PlayAudio]'
-    __PlayerHit: 'type[__PlayerHit]'
-    __RemoveActor: 'type[__RemoveActor]'
-    __RemoveIf: 'type[__RemoveIf]'
-    __SpawnShield: 'type[__SpawnShield]'
-
-    # -----#
+    __slots__ = ()
 
     @classmethod
     def decr_lives(cls) -> 'Action':
-        return cls.__DecreaseLives()
+        return DecreaseLives()
 
     @classmethod
-    def for_each(cls, cb: Callable[['Actor'], Optional['Action']]):
-        return cls.__ForEach(cb)
+    def for_each(
+        cls,
+        cb: Callable[['Actor'], Optional['Action']],
+        query: Optional['Query'] = None,
+    ) -> 'Action':
+        return ForEach(cb, query or Query())
 
     @classmethod
     def incr_score(cls, value: int) -> 'Action':
-        return cls.__IncrScore(value)
+        return IncrScore(value)
 
     @classmethod
-    def play_audio(cls, audio: Sound) -> 'Action':
-        return cls.__PlayAudio(audio)
+    def play_audio(
+        cls, audio: Sound, cause: Optional[tuple[str, float]] = None
+    ) -> 'Action':
+        return PlayAudio(audio, cause=cause)
 
     @classmethod
     def player_hit(cls) -> 'Action':
-        return cls.__PlayerHit()
+        return PlayerHit()
 
     @classmethod
     def register(cls, actor: 'Actor') -> 'Action':
-        return cls.__AddActor(actor)
+        return AddActor(actor)
 
     @classmethod
     def remove(cls, actor: 'Actor') -> 'Action':
-        return cls.__RemoveActor(actor)
+        return RemoveActor(actor)
 
     @classmethod
-    def remove_if(cls, cb: Callable[['Actor'], bool]) -> 'Action':
-        return cls.__RemoveIf(cb)
+    def remove_if(
+        cls,
+        cb: Optional[Callable[['Actor'], bool]] = None,
+        query: Optional['Query'] = None,
+    ) -> 'Action':
+        return RemoveIf(cb, query or Query())
 
     @classmethod
     def set(cls, *actions: 'Action') -> 'Action':
-        return cls.__ActionSet(actions)
+        return ActionSet(actions)
 
     @classmethod
     def spawn_shield(cls) -> 'Action':
-        return cls.__SpawnShield()
-
-    # -----#
-
-    @classmethod
-    def isDecreaseLives(cls, action) -> TypeIs['__DecreaseLives']:
-        return isinstance(action, cls.__DecreaseLives)
-
-    @classmethod
-    def isActionSet(cls, action) -> TypeIs['__ActionSet']:
-        return isinstance(action, cls.__ActionSet)
-
-    @classmethod
-    def isAddActor(cls, action) -> TypeIs['__AddActor']:
-        return isinstance(action, cls.__AddActor)
-
-    @classmethod
-    def isForEach(cls, action) -> TypeIs['__ForEach']:
-        return isinstance(action, cls.__ForEach)
-
-    @classmethod
-    def isIncrScore(cls, action) -> TypeIs['__IncrScore']:
-        return isinstance(action, cls.__IncrScore)
-
-    @classmethod
-    def isPlayAudio(cls, action) -> TypeIs['__PlayAudio']:
-        return isinstance(action, cls.__PlayAudio)
-
-    @classmethod
-    def isPlayerHit(cls, action) -> TypeIs['__PlayerHit']:
-        return isinstance(action, cls.__PlayerHit)
-
-    @classmethod
-    def isRemoveActor(cls, action) -> TypeIs['__RemoveActor']:
-        return isinstance(action, cls.__RemoveActor)
-
-    @classmethod
-    def isRemoveIf(cls, action) -> TypeIs['__RemoveIf']:
-        return isinstance(action, cls.__RemoveIf)
-
-    @classmethod
-    def isSpawnShield(cls, action) -> TypeIs['__SpawnShield']:
-        return isinstance(action, cls.__SpawnShield)
+        return SpawnShield()
 
     def __len__(self) -> int:
         return 1
 
 
-def register_subclass[T](cls: type[T]) -> type[T]:
-    setattr(Action, f'_{Action.__name__}{cls.__name__}', cls)
-    return cls
-
+class ActionSet(Action):
+    __slots__ = ('actions',)
 
-@register_subclass
-class __ActionSet(Action):
     def __init__(self, actions: Iterable[Action]) -> None:
         self.actions = actions
 
 
-@register_subclass
-class __AddActor(Action):
+class AddActor(Action):
+    __slots__ = ('actor',)
+
     def __init__(self, actor: 'Actor') -> None:
         self.actor = actor
 
 
-@register_subclass
-class __DecreaseLives(Action): ...
+class DecreaseLives(Action):
+    __slots__ = ()
+
 
+class ForEach(Action):
+    __slots__ = ('cb', 'query')
 
-@register_subclass
-class __ForEach(Action):
-    # TODO: make it async
-    def __init__(self, cb: Callable[['Actor'], Optional[Action]]) -> None:
+    def __init__(
+        self, cb: Callable[['Actor'], Optional[Action]], query: 'Query'
+    ) -> None:
         self.cb = cb
+        self.query = query
 
 
-@register_subclass
-class __IncrScore(Action):
+class IncrScore(Action):
+    __slots__ = ('value',)
+
     def __init__(self, value: int) -> None:
         self.value = value
 
 
-@register_subclass
-class __PlayAudio(Action):
-    def __init__(self, audio: Sound) -> None:
+class PlayAudio(Action):
+    __slots__ = ('audio', 'count', 'cause')
+
+    def __init__(
+        self,
+        audio: Sound,
+        count: int = 1,
+        cause: Optional[tuple[str, float]] = None,
+    ) -> None:
         self.audio = audio
+        self.count = count
+        # What triggered the sound and when, for the latency log
+        self.cause = cause
+
 
+class PlayerHit(Action):
+    __slots__ = ()
 
-@register_subclass
-class __PlayerHit(Action): ...
 
+class RemoveActor(Action):
+    __slots__ = ('actor',)
 
-@register_subclass
-class __RemoveActor(Action):
     def __init__(self, actor: 'Actor') -> None:
         self.actor = actor
 
 
-@register_subclass
-class __RemoveIf(Action):
-    def __init__(self, cb: Callable[['Actor'], bool]) -> None:
-        self.check = cb
+class RemoveIf(Action):
+    __slots__ = ('check', 'query')
 
+    def __init__(
+        self, cb: Optional[Callable[['Actor'], bool]], query: 'Query'
+    ) -> None:
+        self.check = cb
+        self.query = query
+
+
+class Query:
+    """
+    Selection of live actors: instances of any of `types` (every actor when
+    none is given) whose center lies within `rect`, when given
+    """
+
+    __slots__ = ('types', 'rect')
+
+    def __init__(self, *types: type['Actor'], rect: Optional[Rect] = None) -> None:
+        self.types = types
+        self.rect = rect
+
+
+class SpawnShield(Action):
+    __slots__ = ()
+
+
+class Coalescer:
+    """
+    Merges actions of a command buffer that only add up: identical
+    `PlayAudio` into a single play, kept at the position of the first one,
+    and runs of `IncrScore` into a single increment. Any other action ends
+    a run, so points never move across a `PlayerHit` and the like
+    """
+
+    def __init__(self) -> None:
+        self.seen: int = 0
+        self.audio: int = 0
+        self.score: int = 0
+
+    def coalesce(self, buffer: list[Action]) -> list[Action]:
+        merged: list[Action] = []
+        plays: dict[Sound, int] = {}
+        scores: Optional[int] = None
+        for action in buffer:
+            if type(action) is PlayAudio:
+                index = plays.setdefault(action.audio, len(merged))
+                if index == len(merged):
+                    merged.append(action)
+                else:
+                    first: PlayAudio = merged[index]  # type: ignore
+                    count = first.count + action.count
+                    merged[index] = PlayAudio(
+                        action.audio, count, first.cause or action.cause
+                    )
+                    self.audio += 1
+            elif type(action) is IncrScore:
+                if scores is None:
+                    scores = len(merged)
+                    merged.append(action)
+                else:
+                    value = merged[scores].value + action.value  # type: ignore
+                    merged[scores] = IncrScore(value)
+                    self.score += 1
+            else:
+                scores = None
+                merged.append(action)
+        self.seen += len(buffer)
+        return merged
 
-@register_subclass
-class __SpawnShield(Action): ...
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"seen": self.seen, "audio": self.audio, "score": self.score}
+
+
+class Dispatcher:
+    """
+    Handler table keyed by action type. Action sets are flattened
+    iteratively into a single command buffer, optionally coalesced, then
+    processed in one pass
+    """
+
+    def __init__(self, coalescer: Optional[Coalescer] = None) -> None:
+        self.handlers: dict[type[Action], Callable[[Any], None]] = {}
+        self.coalescer = coalescer
+
+    def register[T: Action](self, kind: type[T], handler: Callable[[T], None]) -> None:
+        self.handlers[kind] = handler
+
+    @staticmethod
+    def flatten(actions: Iterable[Optional[Action]]) -> list[Action]:
+        buffer: list[Action] = []
+        stack: list[Iterator[Optional[Action]]] = [iter(actions)]
+        while stack:
+            for action in stack[-1]:
+                if action is None:
+                    continue
+                if type(action) is ActionSet:
+                    stack.append(iter(action.actions))
+                    break
+                buffer.append(action)
+            else:
+                stack.pop()
+        return buffer
+
+    def dispatch(self, actions: Iterable[Optional[Action]]) -> None:
+        handlers = self.handlers
+        buffer = self.flatten(actions)
+        if self.coalescer is not None:
+            buffer = self.coalescer.coalesce(buffer)
+        for action in buffer:
+            handlers[type(action)](action)
 
 
 ActionPair = tuple[Optional[Action], Optional[Action]]
@@ -180,50 +252,103 @@ ActionPair = tuple[Optional[Action], Optional[Action]]
 
 
 class Actor:
+    # Geometry lives in plain attributes: subclasses that move declare
+    # x, y or radius in their __slots__, the others share these defaults
+    __slots__ = ()
     z: int = 0
+    # Drawn full screen behind everything else, scrolling as a whole
+    backdrop: bool = False
+    x: float = 0.0
+    y: float = 0.0
+    radius: float = 0.0
 
     @property
     def pos(self) -> tuple[int, int]:
-        x, y = self.xy
-        return int(x), int(y)
-
-    @property
-    def radius(self) -> float:
-        return 0
+        return int(self.x), int(self.y)
 
     @property
     def xy(self) -> tuple[float, float]:
-        return 0.0, 0.0
+        return self.x, self.y
 
     def blit(self, *, dest: Surface, src: Surface) -> None:
-        x, y = self.pos
         width, height = src.get_size()
-        dest.blit(src, (x - width / 2, y - height / 2))
+        dest.blit(src, (int(self.x) - width / 2, int(self.y) - height / 2))
 
-    async def update(self, delta: float) -> Optional[Action]: ...
+    # Plain methods: async overrides from legacy actors still work, their
+    # coroutines are run by util.settle
 
-    async def draw(self, surface: Surface) -> None: ...
+    def update(self, delta: float) -> Optional[Action]: ...
 
-    async def react(self, events: list[Event]) -> None: ...
+    def draw(self, surface: Surface) -> None: ...
+
+    def react(self, events: list[Event]) -> None: ...
 
     def squared_distance(self, other: 'Actor') -> float:
-        x0, y0 = self.xy
-        x1, y1 = other.xy
-        dx, dy = x0 - x1, y0 - y1
+        dx, dy = self.x - other.x, self.y - other.y
         return dx * dx + dy * dy
 
     def distance(self, other: 'Actor') -> float:
         return math.sqrt(self.squared_distance(other))
 
 
+class Layer(IntFlag):
+    PLAYER = auto()
+    SHIELD = auto()
+    FIRE = auto()
+    ENEMY_FIRE = auto()
+    FOE = auto()
+    FORCE_FIELD = auto()
+    SENSOR = auto()
+    METEOR = auto()
+    POWER_UP = auto()
+    ALL = (
+        PLAYER
+        | SHIELD
+        | FIRE
+        | ENEMY_FIRE
+        | FOE
+        | FORCE_FIELD
+        | SENSOR
+        | METEOR
+        | POWER_UP
+    )
+
+
 class Collider(Actor):
+    __slots__ = ()
+    # What the collider is, and what it reacts to on collision
+    category: Layer = Layer.ALL
+    mask: Layer = Layer.ALL
+    # Fast movers are tested along the path covered since the last tick
+    swept: bool = False
+    last_xy: Optional[tuple[float, float]] = None
+
+    def interacts(self, other: 'Collider') -> bool:
+        return bool(self.category & other.mask or other.category & self.mask)
+
     def is_colliding(self, other: 'Collider') -> bool:
-        return self.distance(other) <= self.radius + other.radius
+        if self.last_xy is None and other.last_xy is None:
+            return self.distance(other) <= self.radius + other.radius
+        reach = self.radius + other.radius
+        return self.swept_squared_distance(other) <= reach * reach
+
+    def swept_squared_distance(self, other: 'Collider') -> float:
+        """
+        Closest squared distance between both centers while they move from
+        their last position to the current one
+        """
+        x1, y1 = self.x, self.y
+        x0, y0 = self.last_xy or (x1, y1)
+        u1, v1 = other.x, other.y
+        u0, v0 = other.last_xy or (u1, v1)
+        dx, dy = x0 - u0, y0 - v0
+        vx, vy = (x1 - x0) - (u1 - u0), (y1 - y0) - (v1 - v0)
+        speed = vx * vx + vy * vy
+        t = 1.0 if speed == 0 else max(0.0, min(1.0, -(dx * vx + dy * vy) / speed))
+        dx, dy = dx + vx * t, dy + vy * t
+        return dx * dx + dy * dy
 
-    async def on_collision(self, other: 'Collider') -> Optional[Action]: ...
+    def on_collision(self, other: 'Collider') -> Optional[Action]: ...
 
-    async def _process_collision(self, other: 'Collider') -> ActionPair:
-        return await asyncio.gather(
-            self.on_collision(other),
-            other.on_collision(self),
-        )
+    def _process_collision(self, other: 'Collider') -> ActionPair:
+        return self.on_collision(other), other.on_collision(self)
@@ -1,32 +1,76 @@
-import asyncio
 import random
 import sys
-from typing import Coroutine, DefaultDict, Iterable, NoReturn, Optional
+from time import monotonic
+import warnings
+from typing import NoReturn, Optional
+import numpy as np
 import pygame
 from pygame import Surface
 from pygame.mixer import Sound
 from pygame.time import Clock
 
-from action import Action, ActionPair, Actor, Collider
-from consts import BACKGROUND, FPS, RESOLUTION
+from action import (
+    Action,
+    Actor,
+    AddActor,
+    Coalescer,
+    Collider,
+    DecreaseLives,
+    Dispatcher,
+    ForEach,
+    IncrScore,
+    PlayAudio,
+    PlayerHit,
+    RemoveActor,
+    RemoveIf,
+    SpawnShield,
+)
+from assets import assets
+from body import Body, bodies
+from collision import (
+    BroadPhase,
+    NarrowPhase,
+    Vectorized,
+    broad_phases,
+    hidden_branches,
+)
+from consts import (
+    AUDIO_MERGE_GAIN,
+    BACKGROUND,
+    BROAD_PHASE,
+    FPS,
+    INTERPOLATE,
+    MAX_STEPS,
+    RENDERER,
+    RESOLUTION,
+    SIM_RATE,
+    WARM_SCALES,
+)
+from explosion import Explosion
 from fps import FpsDisplay
 from gameover import GameOver
 from life import Lives
+from meteor import Meteor
 from paused import Paused
 from player import Player
+from pool import Pooled
 from powerup import PowerUp
+from registry import Registry
 from reload import Reload
+from render import Interpolation, Renderer, renderers
 from score import Score
 from sounds import AudioBag
 from spawner import FoeSpawner, MeteorSpawner, PowerUpSpawner
 from stars import StarsBackground
+from util import settle
 
 
 class App:
     def __init__(self) -> None:
         random.seed()
+        AudioBag.pre_init()
         pygame.init()
-        AudioBag.init()
+        pygame.mixer.init()
         pygame.mouse.set_visible(False)
         pygame.display.set_caption("Simple PyGame Shooter")
         self.screen: Surface = pygame.display.set_mode(
@@ -34,11 +78,50 @@ class App:
             pygame.DOUBLEBUF | pygame.FULLSCREEN | pygame.SCALED,
             vsync=1,
         )
+        assets.preload(self.loading)
+        AudioBag.init()
+        self.renderer: Renderer = renderers[RENDERER](self.screen)
+        self.interpolation = Interpolation()
         self.paused_display = Paused()
         self.actions: list[Optional[Action]] = []
-        self.sounds: list[Sound] = []
+        self.doomed: dict[Actor, None] = {}
+        self.sounds: dict[Sound, int] = {}
+        self.causes: dict[Sound, tuple[str, float]] = {}
+        self.coalescer = Coalescer()
+        self.dispatcher = Dispatcher(self.coalescer)
+        self.dispatcher.register(AddActor, self.add_actor)
+        self.dispatcher.register(DecreaseLives, self.decrease_lives)
+        self.dispatcher.register(ForEach, self.for_each)
+        self.dispatcher.register(IncrScore, self.incr_score)
+        self.dispatcher.register(PlayAudio, self.play_audio)
+        self.dispatcher.register(PlayerHit, self.player_hit)
+        self.dispatcher.register(RemoveActor, self.remove_actor)
+        self.dispatcher.register(RemoveIf, self.remove_if)
+        self.dispatcher.register(SpawnShield, self.spawn_shield)
+        self.broad_phase: BroadPhase = broad_phases[BROAD_PHASE]()
+        self.narrow_phase: NarrowPhase = Vectorized()
+        if __debug__:
+            for message in hidden_branches():
+                warnings.warn(message)
+        if WARM_SCALES:
+            Meteor.warm()
+            Explosion.warm()
         pygame.mixer_music.load("assets/song.wav")
 
+    def loading(self, done: int, total: int, path: str) -> None:
+        """
+        Progress bar shown while assets are preloaded
+        """
+        width, height = RESOLUTION
+        frame = pygame.Rect(width // 4, height // 2 - 6, width // 2, 12)
+        bar = frame.inflate(-4, -4)
+        bar.width = bar.width * done // total
+        self.screen.fill(BACKGROUND)
+        pygame.draw.rect(self.screen, "white", frame, 1)
+        pygame.draw.rect(self.screen, "white", bar)
+        pygame.display.flip()
+        pygame.event.pump()
+
     def populate(self) -> None:
         """
         Add actors to the world
@@ -58,141 +141,150 @@ class App:
         pygame.mixer_music.play(-1)
         pygame.mixer_music.set_volume(1.0)
 
-    async def check_collisions(self) -> Iterable[Action]:
+    def check_collisions(self) -> list[Optional[Action]]:
         """
         Instantiate all collision objects
         """
-        colliders: list[Collider] = [
-            actor for actor in self.actors if isinstance(actor, Collider)
-        ]
+        colliders: list[Collider] = list(self.actors.of_type(Collider))
         if len(colliders) < 2:
             return []
 
-        futures: list[Coroutine[None, None, ActionPair]] = [
-            actor1._process_collision(actor2)
-            for i, actor1 in enumerate(colliders[: len(colliders) - 1])
-            for actor2 in colliders[i + 1 :]
-            if actor1.is_colliding(actor2)
-        ]
-        first, sec = zip(*await asyncio.gather(*futures)) if futures else ([], [])
-        return [action for action in first + sec if action]
+        actions: list[Optional[Action]] = []
+        pairs = self.narrow_phase.colliding(
+            colliders, self.broad_phase.pairs(colliders)
+        )
+        detected = monotonic()
+        for i, j in pairs:
+            actions.extend(colliders[i]._process_collision(colliders[j]))
+        actions = settle(actions)
+        if AudioBag.voices.latency.enabled:
+            for action in Dispatcher.flatten(actions):
+                if type(action) is PlayAudio:
+                    action.cause = "collision", detected
+        return actions
 
-    async def update(self) -> None:
+    def update(self, delta: float) -> None:
         """
-        Perform update for all actors and collect their actions
+        Advance the simulation by one step of `delta` seconds: update all
+        actors and process their actions
         """
-        delta: float = self.clock.tick(FPS) / 1000
+        self.interpolation.snapshot(self.actors)
         if not self.paused:
-            self.actions = await asyncio.gather(
-                *(actor.update(delta) for actor in self.actors)
+            swept = [c for c in self.actors.of_type(Collider) if c.swept]
+            x, y = bodies.gather(swept, ("x", "y")).tolist()
+            for collider, xy in zip(swept, zip(x, y)):
+                collider.last_xy = xy
+            actions: list[Optional[Action]] = settle(
+                [actor.update(delta) for actor in self.actors]
             )
-            self.actions.extend(await self.check_collisions())
-            self.actions = [action for action in self.actions if action]
-
-            while self.actions:
-                actions = self.actions
-                self.actions = []
-                await asyncio.gather(
-                    *(self.process(action) for action in actions if action)
-                )
+            bodies.integrate(delta)
+            actions.extend(self.check_collisions())
+            self.process(actions)
 
-            for audio in self.sounds:
-                audio.play()
-            self.sounds = []
+            for audio, count in self.sounds.items():
+                AudioBag.voices.play(
+                    audio, 1.0 - AUDIO_MERGE_GAIN / count, self.causes.get(audio)
+                )
+            self.sounds = {}
+            self.causes = {}
 
-        self.actors = [
-            actor
-            for actor in self.actors
-            if isinstance(actor, StarsBackground)
-            or -2 * (1 + actor.radius)
-            < actor.pos[0]
-            < RESOLUTION[0] + 2 * (1 + actor.radius)
-        ]
+        doomed, self.doomed = self.doomed, {}
+        actors = list(self.actors)
+        x, _, radius = bodies.gather(actors)
+        margin = 2 * (1 + radius)
+        outside = (x <= -margin) | (x >= RESOLUTION[0] + margin)
+        for index in np.flatnonzero(outside).tolist():
+            if not isinstance(actors[index], StarsBackground):
+                doomed[actors[index]] = None
+        for actor in doomed:
+            if actor in self.actors:
+                self.actors.remove(actor)
+                self.discard(actor)
 
-    async def process(self, action: Action) -> None:
+    def process(self, actions: list[Optional[Action]]) -> None:
         """
-        Process all collected actions
+        Process all collected actions, and whatever they trigger in turn
         """
-        if Action.isActionSet(action):
-            await asyncio.gather(*(self.process(a) for a in action.actions))
-            return
+        self.actions = actions
+        while self.actions:
+            actions, self.actions = self.actions, []
+            self.dispatcher.dispatch(actions)
 
-        if Action.isAddActor(action):
-            self.actors.insert(0, action.actor)
-            return
+    def add_actor(self, action: AddActor) -> None:
+        self.actors.add(action.actor, first=True)
 
-        if Action.isDecreaseLives(action):
-            self.lives -= 1
-            return
+    def decrease_lives(self, action: DecreaseLives) -> None:
+        self.lives -= 1
 
-        if Action.isForEach(action):
-            for actor in self.actors:
-                res = action.cb(actor)
-                if res:
-                    self.actions.append(res)
-
-        if Action.isPlayAudio(action):
-            self.sounds.append(action.audio)
-
-        if Action.isPlayerHit(action):
-            if self.lives <= 1:
-                self.lives -= 1
-                self.actors.append(GameOver())
-                self.game_over = True
-            else:
-                self.actors.append(Reload())
-            return
+    def for_each(self, action: ForEach) -> None:
+        cb = action.cb
+        self.actions.extend([cb(actor) for actor in self.actors.select(action.query)])
 
-        if Action.isIncrScore(action):
-            if not self.game_over:
-                self.score += action.value
-            return
+    def incr_score(self, action: IncrScore) -> None:
+        if not self.game_over:
+            self.score += action.value
 
-        if Action.isRemoveActor(action):
-            try:
-                self.actors.remove(action.actor)
-            except ValueError:
-                print(
-                    sys.stderr, f"{action.actor} was supposed to be in the actors list"
-                )
-            return
+    def play_audio(self, action: PlayAudio) -> None:
+        self.sounds[action.audio] = self.sounds.get(action.audio, 0) + action.count
+        if action.cause is not None:
+            self.causes.setdefault(action.audio, action.cause)
 
-        if Action.isRemoveIf(action):
-            actors: list[Actor] = []
-            for actor in self.actors:
-                if not action.check(actor):
-                    actors.append(actor)
-            self.actors = actors
-            return
+    def player_hit(self, action: PlayerHit) -> None:
+        if self.lives <= 1:
+            self.lives -= 1
+            self.actors.add(GameOver())
+            self.game_over = True
+        else:
+            self.actors.add(Reload())
+
+    def remove_actor(self, action: RemoveActor) -> None:
+        try:
+            self.actors.remove(action.actor)
+        except ValueError:
+            print(sys.stderr, f"{action.actor} was supposed to be in the actors list")
+        else:
+            self.discard(action.actor)
 
-        if Action.isSpawnShield(action):
-            for actor in self.actors:
-                if isinstance(actor, PowerUp) and actor.power == PowerUp.shield:
-                    return
-            else:
-                y = random.randint(24, RESOLUTION[1] - 24)
-                speed = 50 + random.random() * 50
-                self.actors.append(PowerUp(y, speed, power=PowerUp.shield))
+    def remove_if(self, action: RemoveIf) -> None:
+        """
+        Mark the matching actors, they leave the world with the culling pass
+        at the end of the frame
+        """
+        check = action.check
+        for actor in self.actors.select(action.query):
+            if check is None or check(actor):
+                self.doomed[actor] = None
+
+    def spawn_shield(self, action: SpawnShield) -> None:
+        if any(self.actors.keyed(PowerUp, "power", PowerUp.shield)):
             return
+        y = random.randint(24, RESOLUTION[1] - 24)
+        speed = 50 + random.random() * 50
+        self.actors.add(PowerUp(y, speed, power=PowerUp.shield))
 
-    async def draw(self) -> None:
+    def discard(self, actor: Actor) -> None:
         """
-        Draw actors on overlapped layers by z-axis
+        Hand back the resources of an actor leaving the world
         """
-        self.screen.fill(BACKGROUND)
-        layers: dict[int, Surface] = DefaultDict(
-            lambda: Surface(RESOLUTION, pygame.SRCALPHA)
-        )
-        # Asynchronous drawing
-        await asyncio.gather(*(actor.draw(layers[actor.z]) for actor in self.actors))
-        # Synchronous drawing
-        for _, layer in sorted(
-            (pair for pair in layers.items()), key=lambda pair: pair[0]
-        ):
-            self.screen.blit(layer, (0, 0))
-        pygame.display.flip()
+        self.doomed.pop(actor, None)
+        self.interpolation.previous.pop(actor, None)
+        if isinstance(actor, Pooled):
+            actor.release()
+        elif isinstance(actor, Body):
+            actor.detach()
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw actors by z-axis, `alpha` of the way between the last two
+        simulation steps
+        """
+        if INTERPOLATE and alpha < 1.0:
+            with self.interpolation.blend(alpha):
+                self.renderer.draw(self.actors)
+        else:
+            self.renderer.draw(self.actors)
 
-    async def events(self) -> None:
+    def events(self) -> None:
         """
         Process global events and delegate object dedicated events
         """
@@ -218,25 +310,37 @@ class App:
             ):
                 self.paused = not self.paused
                 if self.paused:
-                    self.actors.append(self.paused_display)
+                    self.actors.add(self.paused_display)
                     pygame.mixer_music.pause()
                 else:
                     self.actors.remove(self.paused_display)
                     pygame.mixer_music.unpause()
-        await asyncio.gather(*(actor.react(events) for actor in self.actors))
+        settle([actor.react(events) for actor in self.actors])
 
-    async def start(self) -> NoReturn:
+    def start(self) -> NoReturn:
         while True:
             self.clock = Clock()
             self.score: int = 0
-            self.actors: list[Actor] = []
+            self.actors = Registry()
+            self.doomed = {}
+            bodies.clear()
             self.lives: int = 3
             self.reset: bool = False
             self.game_over: bool = False
             self.paused: bool = False
             self.populate()
 
+            step = 1 / SIM_RATE
+            elapsed = 0.0
             while not self.reset:
-                await self.events()
-                await self.update()
-                await self.draw()
+                self.events()
+                elapsed += self.clock.tick(FPS) / 1000
+                steps = 0
+                while elapsed >= step and steps < MAX_STEPS:
+                    self.update(step)
+                    elapsed -= step
+                    steps += 1
+                if steps == MAX_STEPS:
+                    # Too far behind to catch up: drop the backlog
+                    elapsed = min(elapsed, step)
+                self.draw(elapsed / step)
@@ -0,0 +1,281 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from hashlib import blake2b
+from io import BytesIO
+import json
+import mmap
+import os
+import struct
+from typing import Callable, Optional
+import warnings
+import pygame
+from pygame import Surface
+from pygame.font import Font
+from pygame.mixer import Sound
+
+
+ROOT = "assets"
+CACHE = ".cache/assets"
+# Streamed by the mixer while it plays, never decoded up front
+STREAMED = {"assets/song.wav"}
+
+Progress = Callable[[int, int, str], None]
+
+
+def manifest(root: str = ROOT) -> list[str]:
+    """
+    Every file under `root`, as slash separated paths in a stable order
+    """
+    paths: list[str] = []
+    for folder, _, names in os.walk(root):
+        paths.extend(os.path.join(folder, name).replace(os.sep, "/") for name in names)
+    return sorted(paths)
+
+
+def decode(path: str) -> Surface | Sound | bytes:
+    """
+    Load one file by extension; fonts are kept as raw bytes, since a Font
+    is bound to a size
+    """
+    match os.path.splitext(path)[1]:
+        case ".png":
+            return pygame.image.load(path)
+        case ".wav":
+            return Sound(path)
+        case _:
+            with open(path, "rb") as file:
+                return file.read()
+
+
+class Baked:
+    """
+    Final pixel buffers on disk, named after a hash of their source files
+    and of the parameters of the transform that produced them, so editing
+    an asset invalidates them. Loading one maps the file and wraps it in a
+    surface, with no decoding. An index keeps the sources and parameters of
+    each file, so `prune` can tell the stale ones
+    """
+
+    header = struct.Struct("<II")
+
+    def __init__(self, root: str = CACHE) -> None:
+        self.root = root
+        self.digests: dict[str, bytes] = {}
+        self._format: Optional[str] = None
+        self._index: Optional[dict[str, tuple[str, list[str]]]] = None
+        # Cleared on the first failed write, e.g. on a read-only disk
+        self.writable: bool = True
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def format(self) -> str:
+        """
+        Byte order of the display alpha format, so surfaces need no convert
+        """
+        if self._format is None:
+            masks = Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+            self._format = "BGRA" if masks[0] == 0xFF0000 else "RGBA"
+        return self._format
+
+    def digest(self, path: str) -> bytes:
+        if path not in self.digests:
+            with open(path, "rb") as file:
+                self.digests[path] = blake2b(file.read(), digest_size=16).digest()
+        return self.digests[path]
+
+    def key(self, sources: list[str], params: str) -> str:
+        digest = blake2b(params.encode(), digest_size=16)
+        for path in sources:
+            digest.update(self.digest(path))
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.{self.format.lower()}")
+
+    def load(self, key: str) -> Optional[Surface]:
+        """
+        Mapped surface, or None when missing or unreadable. Truncated files,
+        left by an interrupted run, count as missing and are deleted
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                # Copy on write: the surface stays drawable, the file untouched
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+            width, height = self.header.unpack_from(data)
+            if len(data) < self.header.size + width * height * 4:
+                raise ValueError(f"truncated {path}")
+            pixels = memoryview(data)[self.header.size :]
+            return pygame.image.frombuffer(pixels, (width, height), self.format)
+        except OSError:
+            return None
+        except (ValueError, struct.error):
+            with suppress(OSError):
+                os.remove(path)
+            return None
+
+    def find(self, sources: list[str], params: str) -> Optional[Surface]:
+        surface = self.load(self.key(sources, params))
+        if surface is not None:
+            self.hits += 1
+        return surface
+
+    @property
+    def index(self) -> dict[str, tuple[str, list[str]]]:
+        """
+        Parameters and sources of every baked file, by key
+        """
+        if self._index is None:
+            try:
+                with open(os.path.join(self.root, "index.json")) as file:
+                    self._index = {
+                        key: (params, sources)
+                        for key, (params, sources) in json.load(file).items()
+                    }
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def write(self, path: str, data: bytes) -> None:
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(data)
+        os.replace(f"{path}.tmp", path)
+
+    def save(self, sources: list[str], params: str, surface: Surface) -> None:
+        if not self.writable:
+            return
+        key = self.key(sources, params)
+        data = self.header.pack(*surface.get_size())
+        data += pygame.image.tobytes(surface, self.format)
+        self.index[key] = params, sources
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            self.write(self.path(key), data)
+            self.write(
+                os.path.join(self.root, "index.json"), json.dumps(self.index).encode()
+            )
+        except OSError as error:
+            self.writable = False
+            warnings.warn(f"asset cache disabled: {error}")
+
+    def prune(self) -> None:
+        """
+        Delete baked files whose sources changed or are gone, and files the
+        index does not list, such as leftovers of interrupted writes
+        """
+        if not os.path.isdir(self.root):
+            return
+        index = self.index
+        live = {
+            key: (params, sources)
+            for key, (params, sources) in index.items()
+            if all(os.path.isfile(path) for path in sources)
+            and self.key(sources, params) == key
+        }
+        try:
+            for name in os.listdir(self.root):
+                if name != "index.json" and os.path.splitext(name)[0] not in live:
+                    os.remove(os.path.join(self.root, name))
+            if live != index:
+                self._index = live
+                self.write(
+                    os.path.join(self.root, "index.json"), json.dumps(live).encode()
+                )
+        except OSError as error:
+            warnings.warn(f"asset cache not pruned: {error}")
+
+    def get(
+        self, sources: list[str], params: str, build: Callable[[], Surface]
+    ) -> Surface:
+        """
+        Cached result of `build`, which must only depend on `sources` and
+        `params`
+        """
+        surface = self.find(sources, params)
+        if surface is None:
+            self.misses += 1
+            surface = build().convert_alpha()
+            self.save(sources, params, surface)
+        return surface
+
+
+class Assets:
+    """
+    Decoded assets by path. `preload` decodes the whole manifest on a
+    thread pool; whatever is requested before that is loaded on the spot
+    """
+
+    def __init__(self) -> None:
+        self.baked = Baked()
+        self.images: dict[tuple[str, Optional[tuple[int, int]]], Surface] = {}
+        self.sounds: dict[str, Sound] = {}
+        self.files: dict[str, bytes] = {}
+        self.fonts: dict[tuple[str, int], Font] = {}
+
+    def preload(
+        self, progress: Optional[Progress] = None, workers: Optional[int] = None
+    ) -> None:
+        self.baked.prune()
+        paths = [path for path in manifest() if path not in STREAMED]
+        pending: list[str] = []
+        done = 0
+        for path in paths:
+            # Baked images are only mapped, the rest goes to the thread pool
+            surface = None
+            if path.endswith(".png"):
+                surface = self.baked.find([path], "image")
+            if surface is None:
+                pending.append(path)
+                continue
+            self.images[path, None] = surface
+            done += 1
+            if progress is not None:
+                progress(done, len(paths), path)
+        with ThreadPoolExecutor(workers) as pool:
+            futures = {pool.submit(decode, path): path for path in pending}
+            for done, future in enumerate(as_completed(futures), done + 1):
+                # Surfaces are converted and baked here, on the main thread
+                self.store(futures[future], future.result())
+                if progress is not None:
+                    progress(done, len(paths), futures[future])
+
+    def store(self, path: str, asset: Surface | Sound | bytes) -> None:
+        if isinstance(asset, Surface):
+            self.images[path, None] = self.baked.get([path], "image", lambda: asset)
+        elif isinstance(asset, Sound):
+            self.sounds[path] = asset
+        else:
+            self.files[path] = asset
+
+    def image(self, path: str, size: Optional[tuple[int, int]] = None) -> Surface:
+        """
+        Image at `path`, scaled to `size` when given
+        """
+        key = path, size
+        if key not in self.images:
+            if size is None:
+                self.store(path, decode(path))
+            else:
+                self.images[key] = self.baked.get(
+                    [path],
+                    f"scale:{size}",
+                    lambda: pygame.transform.scale(self.image(path), size),
+                )
+        return self.images[key]
+
+    def sound(self, path: str) -> Sound:
+        if path not in self.sounds:
+            self.store(path, decode(path))
+        return self.sounds[path]
+
+    def font(self, path: str, size: int) -> Font:
+        key = path, size
+        if key not in self.fonts:
+            if path not in self.files:
+                self.store(path, decode(path))
+            self.fonts[key] = Font(BytesIO(self.files[path]), size)
+        return self.fonts[key]
+
+
+assets = Assets()
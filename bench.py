@@ -0,0 +1,462 @@
+"""
+Micro-benchmarks for the engine hot paths
+
+Usage: python bench.py [name ...]
+"""
+
+import asyncio
+import random
+import sys
+from random import Random
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Optional
+from action import (
+    Action,
+    ActionSet,
+    Actor,
+    AddActor,
+    Collider,
+    Dispatcher,
+    IncrScore,
+    PlayAudio,
+    RemoveActor,
+)
+from body import bodies
+from collision import (
+    BroadPhase,
+    BruteForce,
+    NarrowPhase,
+    SpatialHash,
+    SweepAndPrune,
+    Vectorized,
+)
+import numpy as np
+import pygame
+from pygame import Surface
+from consts import RESOLUTION
+from fire import Fire
+from stars import StarsBackground
+from util import settle
+
+
+benchmarks: dict[str, Callable[[], None]] = {}
+
+
+def benchmark(fn: Callable[[], None]) -> Callable[[], None]:
+    benchmarks[fn.__name__] = fn
+    return fn
+
+
+def timeit(fn: Callable[[], object], *, repeat: int = 5) -> float:
+    """
+    Best wall time of `repeat` runs, in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best * 1000
+
+
+class Dot(Collider):
+    __slots__ = ("x", "y", "radius", "last_xy")
+
+    def __init__(self, x: float, y: float, radius: float) -> None:
+        self.x, self.y, self.radius = x, y, radius
+        self.last_xy = None
+
+
+# Bullets dominate, then foes, power-ups and the odd sensor or meteor
+RADII = [6.0] * 12 + [12.0] * 2 + [24.0, 32.0, 32.0, 37.5, 100.0]
+
+
+def scatter(count: int, *, seed: int = 0) -> list[Collider]:
+    rnd = Random(seed)
+    width, height = RESOLUTION
+    return [
+        Dot(rnd.uniform(0, width), rnd.uniform(0, height), rnd.choice(RADII))
+        for _ in range(count)
+    ]
+
+
+def colliding(
+    broad_phase: BroadPhase, narrow_phase: NarrowPhase, colliders: list[Collider]
+) -> list[tuple[int, int]]:
+    return narrow_phase.colliding(colliders, broad_phase.pairs(colliders))
+
+
+@benchmark
+def collisions() -> None:
+    """
+    Broad phase strategies, each with the pair-wise and the NumPy narrow phase
+    """
+    strategies = {
+        "brute": BruteForce(),
+        "hash": SpatialHash(),
+        "sap": SweepAndPrune(),
+    }
+    narrow_phases = {"": NarrowPhase(), "+np": Vectorized()}
+    columns = [f"{b}{n}" for b in strategies for n in narrow_phases]
+    print(f"{'colliders':>9} {'pairs':>8}", *(f"{c:>12}" for c in columns))
+    for count in [50, 100, 250, 500, 1000, 2500, 5000]:
+        colliders = scatter(count)
+        expected = colliding(BruteForce(), NarrowPhase(), colliders)
+        repeat = 5 if count <= 1000 else 1
+        times = []
+        for broad_phase in strategies.values():
+            for narrow_phase in narrow_phases.values():
+                assert colliding(broad_phase, narrow_phase, colliders) == expected
+                times.append(
+                    timeit(
+                        lambda: colliding(broad_phase, narrow_phase, colliders),
+                        repeat=repeat,
+                    )
+                )
+        print(f"{count:>9} {len(expected):>8}", *(f"{t:>9.2f} ms" for t in times))
+
+
+@benchmark
+def scrolling() -> None:
+    """
+    Per-frame broad phase cost while colliders scroll along the x axis,
+    which is where sweep and prune keeps its list nearly sorted
+    """
+    narrow_phase = Vectorized()
+    width = RESOLUTION[0]
+    print(f"{'colliders':>9}", *(f"{c:>12}" for c in ["brute", "hash", "sap"]))
+    for count in [50, 100, 250, 500, 1000, 2500, 5000]:
+        colliders = scatter(count)
+        rnd = Random(count)
+        # Bullets fly right, everything else drifts left
+        speeds = [
+            1200.0 if rnd.random() < 0.25 else -rnd.uniform(50, 400)
+            for _ in colliders
+        ]
+        frames = 30 if count <= 1000 else 5
+        strategies = [BruteForce(), SpatialHash(), SweepAndPrune()]
+        times = [0.0] * len(strategies)
+        for _ in range(frames):
+            for dot, speed in zip(colliders, speeds):
+                dot.x = (dot.x + speed / 60) % width
+            expected = None
+            for k, strategy in enumerate(strategies):
+                start = perf_counter()
+                pairs = colliding(strategy, narrow_phase, colliders)
+                times[k] += perf_counter() - start
+                assert expected is None or pairs == expected
+                expected = pairs
+        print(f"{count:>9}", *(f"{t * 1000 / frames:>9.2f} ms" for t in times))
+
+
+class Mover:
+    def __init__(self, x: float, y: float, vx: float, vy: float) -> None:
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+
+    def update(self, delta: float) -> None:
+        self.x += self.vx * delta
+        self.y += self.vy * delta
+
+
+def fires(count: int, *, seed: int = 0) -> list[Fire]:
+    """
+    Live bullets flying right, in the shared body store as in the game
+    """
+    rnd = Random(seed)
+    width, height = RESOLUTION
+    return [
+        Fire.acquire(
+            (rnd.uniform(0, width), rnd.uniform(0, height)), 0.0, power=0, quiet=True
+        )
+        for _ in range(count)
+    ]
+
+
+def release(live: list[Fire]) -> None:
+    for fire in live:
+        fire.release()
+    Fire.pool.free.clear()
+    bodies.clear()
+
+
+@benchmark
+def movement() -> None:
+    """
+    Per-actor straight-line movement against real bullets: their update
+    plus one body store integration, and the integration alone
+    """
+    pygame.display.set_mode(RESOLUTION, pygame.HIDDEN)
+    print(f"{'movers':>9} {'per-actor':>12} {'bullets':>12} {'store':>12} {'x':>6}")
+    for count in [100, 1000, 10_000, 100_000]:
+        rnd = Random(count)
+        movers = [
+            Mover(rnd.uniform(0, 1280), rnd.uniform(0, 720), -1200.0, 0.0)
+            for _ in range(count)
+        ]
+        live = fires(count, seed=count)
+
+        def per_actor() -> None:
+            for mover in movers:
+                mover.update(1 / 60)
+
+        def bullets() -> None:
+            for fire in live:
+                fire.update(1 / 60)
+            bodies.integrate(1 / 60)
+
+        t0 = timeit(per_actor)
+        t1 = timeit(bullets)
+        t2 = timeit(lambda: bodies.integrate(1 / 60))
+        print(f"{count:>9} {t0:>9.3f} ms {t1:>9.3f} ms {t2:>9.3f} ms {t0 / t1:>6.1f}")
+        release(live)
+    pygame.display.quit()
+
+
+class Legacy:
+    """
+    Actor layout before __slots__: a full __dict__ and computed geometry
+    """
+
+    def __init__(self, x: float, y: float, radius: float) -> None:
+        self.x, self.y, self._radius = x, y, radius
+
+    @property
+    def pos(self) -> tuple[int, int]:
+        x, y = self.xy
+        return int(x), int(y)
+
+    @property
+    def xy(self) -> tuple[float, float]:
+        return self.x, self.y
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+
+def legacy_frame(actors: list[Legacy]) -> None:
+    width = RESOLUTION[0]
+    [a.xy for a in actors]
+    [a.radius for a in actors]
+    [a.pos for a in actors]
+    [a for a in actors if -2 * (1 + a.radius) < a.pos[0] < width + 2 * (1 + a.radius)]
+
+
+def slotted_frame(actors: list[Dot] | list[Fire]) -> None:
+    width = RESOLUTION[0]
+    [(a.x, a.y) for a in actors]
+    [a.radius for a in actors]
+    [(int(a.x), int(a.y)) for a in actors]
+    [a for a in actors if -2 * (1 + a.radius) < a.x < width + 2 * (1 + a.radius)]
+
+
+def gathered_frame(actors: list[Fire]) -> None:
+    # Collision gather and culling read the body store in bulk
+    width = RESOLUTION[0]
+    x, y, radius = bodies.gather(actors)
+    [a.pos for a in actors]
+    margin = 2 * (1 + radius)
+    np.flatnonzero((x <= -margin) | (x >= width + margin))
+
+
+@benchmark
+def actors() -> None:
+    """
+    Memory and per-frame geometry access (collision gather, blit position
+    and culling) for 10k live actors: the legacy layout, plain slots, and
+    real bullets read attribute by attribute or gathered from their store
+    """
+    pygame.display.set_mode(RESOLUTION, pygame.HIDDEN)
+    count = 10_000
+    rnd = Random(count)
+    coords = [
+        (rnd.uniform(0, 1280), rnd.uniform(0, 720), rnd.choice(RADII))
+        for _ in range(count)
+    ]
+    for name, make, frame in [
+        ("legacy", lambda: [Legacy(*coord) for coord in coords], legacy_frame),
+        ("slotted", lambda: [Dot(*coord) for coord in coords], slotted_frame),
+        ("columns", lambda: fires(count), slotted_frame),
+        ("gathered", lambda: fires(count), gathered_frame),
+    ]:
+        tracemalloc.start()
+        live = make()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        elapsed = timeit(lambda: frame(live))  # type: ignore
+        print(f"{name:>8} {size / 1024:>9.0f} KiB {elapsed:>9.2f} ms/frame")
+        if name in ["columns", "gathered"]:
+            release(live)
+    pygame.display.quit()
+
+
+class Sink:
+    """
+    App stand-in whose handlers only count what they receive
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def handle(self, action: Action) -> None:
+        self.count += 1
+
+    async def process(self, action: Action) -> None:
+        # The isinstance chain and recursive gather App.process used to run
+        if isinstance(action, ActionSet):
+            await asyncio.gather(*(self.process(a) for a in action.actions))
+            return
+        for kind in [AddActor, IncrScore, PlayAudio, RemoveActor]:
+            if isinstance(action, kind):
+                self.handle(action)
+                return
+
+
+def explosions(count: int) -> list[Action]:
+    """
+    One frame worth of kills: each one registers an explosion, removes the
+    foe and the bullet, plays a sound and scores
+    """
+    actor = Collider()
+    return [
+        Action.set(
+            Action.set(Action.register(actor), Action.remove(actor)),
+            Action.remove(actor),
+            Action.play_audio(None),  # type: ignore
+            Action.incr_score(10),
+        )
+        for _ in range(count)
+    ]
+
+
+@benchmark
+def actions() -> None:
+    """
+    Actions processed per second: isinstance chain with recursive gather
+    against the dispatch table over a flattened command buffer
+    """
+    sink = Sink()
+    dispatcher = Dispatcher()
+    for kind in [AddActor, IncrScore, PlayAudio, RemoveActor]:
+        dispatcher.register(kind, sink.handle)
+
+    async def legacy(frame: list[Action]) -> None:
+        await asyncio.gather(*(sink.process(action) for action in frame))
+
+    loop = asyncio.new_event_loop()
+    print(f"{'sets':>9} {'legacy':>14} {'dispatch':>14} {'x':>6}")
+    for count in [10, 100, 1000, 10_000]:
+        frame = explosions(count)
+        processed = 5 * count
+        t0 = timeit(lambda: loop.run_until_complete(legacy(frame)))
+        t1 = timeit(lambda: dispatcher.dispatch(frame))
+        rates = processed / t0 * 1000, processed / t1 * 1000
+        print(f"{count:>9}", *(f"{rate:>12.0f}/s" for rate in rates), f"{t0 / t1:>6.1f}")
+    loop.close()
+
+
+class Ticker(Actor):
+    __slots__ = ("x",)
+
+    def __init__(self) -> None:
+        self.x = 0.0
+
+    def update(self, delta: float) -> Optional[Action]:
+        self.x += delta
+        return None
+
+
+class AsyncTicker(Ticker):
+    __slots__ = ()
+
+    async def update(self, delta: float) -> Optional[Action]:  # type: ignore
+        self.x += delta
+        return None
+
+
+@benchmark
+def ticks() -> None:
+    """
+    Frame time of the update pass: one coroutine per actor gathered on the
+    event loop, against plain calls, with a few legacy async actors mixed in
+    """
+
+    async def gathered(live: list[Actor]) -> list[Optional[Action]]:
+        return await asyncio.gather(*(actor.update(1 / 60) for actor in live))
+
+    loop = asyncio.new_event_loop()
+    print(f"{'actors':>9} {'gather':>12} {'sync':>12} {'mixed':>12} {'x':>6}")
+    for count in [10, 100, 1000, 10_000]:
+        legacy: list[Actor] = [AsyncTicker() for _ in range(count)]
+        live: list[Actor] = [Ticker() for _ in range(count)]
+        mixed = live[:-1] + legacy[-1:]
+        t0 = timeit(lambda: loop.run_until_complete(gathered(legacy)))
+        t1 = timeit(lambda: settle([actor.update(1 / 60) for actor in live]))
+        t2 = timeit(lambda: settle([actor.update(1 / 60) for actor in mixed]))
+        print(
+            f"{count:>9}",
+            *(f"{t:>9.3f} ms" for t in (t0, t1, t2)),
+            f"{t0 / t1:>6.0f}",
+        )
+    loop.close()
+
+
+class LegacyStars:
+    """
+    Starfield before pre-compositing: three translucent full-screen layers
+    """
+
+    def __init__(self) -> None:
+        self.facets = [Surface(RESOLUTION, pygame.SRCALPHA) for _ in range(3)]
+        self.xs = [10.0, 0.0, 0.0]
+        for i, facet in enumerate(self.facets):
+            pygame.draw.rect(facet, "#00000080", (0, 0, *RESOLUTION))
+            for x in range(0, RESOLUTION[0], 1 << i):
+                y = random.randint(0, RESOLUTION[1])
+                color = random.choice(StarsBackground.colors)
+                pygame.draw.circle(facet, color, (x, y), i + 1)
+
+    def draw(self, surface: Surface) -> None:
+        width = RESOLUTION[0]
+        for i, facet in enumerate(self.facets):
+            surface.blit(facet, (self.xs[i] - width, 0))
+            surface.blit(facet, (self.xs[i], 0))
+
+
+@benchmark
+def stars() -> None:
+    """
+    Background draw over a black screen: translucent layers against
+    pre-composited opaque and color keyed strips, at a few densities
+    """
+    screen = pygame.display.set_mode(RESOLUTION, pygame.HIDDEN)
+    random.seed(0)
+    legacy = LegacyStars()
+    random.seed(0)
+    current = StarsBackground()
+    frames = []
+    for starfield in [legacy, current]:
+        starfield.xs = [100.0, 200.0, 300.0]
+        screen.fill("black")
+        starfield.draw(screen)
+        frames.append(pygame.image.tobytes(screen, "RGB"))
+    assert frames[0] == frames[1]
+
+    def frame(starfield: LegacyStars | StarsBackground) -> None:
+        screen.fill("black")
+        starfield.draw(screen)
+
+    print(f"{'density':>9} {'legacy':>12} {'strips':>12} {'x':>6}")
+    t0 = timeit(lambda: frame(legacy), repeat=20)
+    for density in [0.5, 1.0, 2.0]:
+        starfield = StarsBackground(density)
+        t1 = timeit(lambda: frame(starfield), repeat=20)
+        print(f"{density:>9} {t0:>9.2f} ms {t1:>9.2f} ms {t0 / t1:>6.1f}")
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or benchmarks:
+        print(f"# {name}")
+        benchmarks[name]()
@@ -0,0 +1,140 @@
+from typing import Any, Optional, Sequence
+import numpy as np
+
+
+class BodyStore:
+    """
+    Struct-of-arrays storage for the kinematic state of straight-line movers,
+    integrated in a single vectorized step per frame
+    """
+
+    columns = ("x", "y", "vx", "vy", "radius", "angle", "spin")
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.data = np.zeros((len(self.columns), capacity), dtype=np.float64)
+        self.size: int = 0
+        self.free: list[int] = []
+
+    def __len__(self) -> int:
+        return self.size - len(self.free)
+
+    def alloc(self) -> int:
+        if self.free:
+            return self.free.pop()
+        if self.size == self.data.shape[1]:
+            data = np.zeros((len(self.columns), self.size * 2), dtype=np.float64)
+            data[:, : self.size] = self.data
+            self.data = data
+        self.size += 1
+        return self.size - 1
+
+    def release(self, row: int) -> None:
+        # Zeroed rows stay put on integration
+        self.data[:, row] = 0.0
+        self.free.append(row)
+
+    def clear(self) -> None:
+        self.data.fill(0.0)
+        self.size = 0
+        self.free = []
+
+    def gather(
+        self, actors: Sequence[Any], columns: Sequence[str] = ("x", "y", "radius")
+    ) -> np.ndarray:
+        """
+        Columns of `actors` as a (len(columns), len(actors)) array. Rows of
+        bodies in this store are copied with one fancy index, other actors
+        are read attribute by attribute
+        """
+        out = np.empty((len(columns), len(actors)), dtype=np.float64)
+        at: list[int] = []
+        rows: list[int] = []
+        for i, actor in enumerate(actors):
+            if isinstance(actor, Body) and actor.store is self:
+                at.append(i)
+                rows.append(actor.row)
+            else:
+                out[:, i] = [getattr(actor, name) for name in columns]
+        if rows:
+            index = [self.columns.index(name) for name in columns]
+            out[:, at] = self.data[np.ix_(index, rows)]
+        return out
+
+    def scatter(
+        self, actors: Sequence[Any], columns: Sequence[str], values: np.ndarray
+    ) -> None:
+        """
+        Inverse of `gather`
+        """
+        at: list[int] = []
+        rows: list[int] = []
+        for i, actor in enumerate(actors):
+            if isinstance(actor, Body) and actor.store is self:
+                at.append(i)
+                rows.append(actor.row)
+            else:
+                for name, value in zip(columns, values[:, i].tolist()):
+                    setattr(actor, name, value)
+        if rows:
+            index = [self.columns.index(name) for name in columns]
+            self.data[np.ix_(index, rows)] = values[:, at]
+
+    def integrate(self, delta: float) -> None:
+        x, y, vx, vy, _, angle, spin = self.data[:, : self.size]
+        x += vx * delta
+        y += vy * delta
+        angle += spin * delta
+
+
+bodies = BodyStore()
+
+
+class Column:
+    """
+    Attribute backed by a body store row. Fine for a few reads per actor;
+    loops over many actors go through `BodyStore.gather` instead
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.index = BodyStore.columns.index(name)
+
+    def __get__(self, body: Optional["Body"], owner: type) -> float:
+        if body is None:
+            return self  # type: ignore
+        return body.store.data.item(self.index, body.row)
+
+    def __set__(self, body: "Body", value: float) -> None:
+        body.store.data[self.index, body.row] = value
+
+
+class Body:
+    """
+    Thin handle over a body store row, mixed in before Actor
+    """
+
+    __slots__ = ("store", "row")
+    store: BodyStore
+    row: int
+
+    x = Column()
+    y = Column()
+    vx = Column()
+    vy = Column()
+    radius = Column()
+    angle = Column()
+    spin = Column()
+
+    def attach(self, store: BodyStore = bodies) -> None:
+        self.store = store
+        self.row = store.alloc()
+
+    def detach(self) -> None:
+        """
+        Move the state into a private row once the actor leaves the world,
+        so lingering references still read its last position
+        """
+        store = BodyStore(capacity=1)
+        row = store.alloc()
+        store.data[:, row] = self.store.data[:, self.row]
+        self.store.release(self.row)
+        self.store, self.row = store, row
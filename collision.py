@@ -0,0 +1,276 @@
+import ast
+from bisect import insort
+from importlib import import_module
+import inspect
+from itertools import chain, combinations, islice
+from operator import itemgetter
+from textwrap import dedent
+from types import FunctionType
+from typing import Any, Iterable, Iterator, Sequence
+import numpy as np
+from action import Collider
+from body import bodies
+
+
+Pair = tuple[int, int]
+
+
+def geometry(
+    colliders: Sequence[Collider],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Current centers, centers at the last tick and radii, as (n, 2), (n, 2)
+    and (n,) arrays
+    """
+    x, y, radii = bodies.gather(colliders)
+    xy = np.column_stack((x, y))
+    last = xy.copy()
+    swept = [(i, c.last_xy) for i, c in enumerate(colliders) if c.last_xy is not None]
+    if swept:
+        at, points = zip(*swept)
+        last[list(at)] = points
+    return xy, last, radii
+
+
+def bounds(colliders: Sequence[Collider]) -> list[list[float]]:
+    """
+    Left, right, top and bottom edges of the area each collider swept
+    during the last tick
+    """
+    xy, last, radii = geometry(colliders)
+    low = np.minimum(xy, last) - radii[:, None]
+    high = np.maximum(xy, last) + radii[:, None]
+    return np.column_stack((low[:, 0], high[:, 0], low[:, 1], high[:, 1])).tolist()
+
+
+class BroadPhase:
+    """
+    Select the collider pairs that deserve a narrow phase test
+    """
+
+    def pairs(self, colliders: Sequence[Collider]) -> Iterable[Pair]:
+        """
+        Return candidate index pairs (i < j) in brute-force order
+        """
+        ...
+
+
+class BruteForce(BroadPhase):
+    def pairs(self, colliders: Sequence[Collider]) -> Iterable[Pair]:
+        return combinations(range(len(colliders)), 2)
+
+
+class SpatialHash(BroadPhase):
+    """
+    Uniform grid rebuilt every tick: each collider is hashed into every cell
+    its bounding box touches, so overlapping circles always share a cell
+    """
+
+    def __init__(self, cell_size: float = 64.0, max_cells: int = 64) -> None:
+        self.cell_size = cell_size
+        # Huge colliders (nuke shockwave) are tested against everybody
+        self.max_cells = max_cells
+
+    def pairs(self, colliders: Sequence[Collider]) -> Iterable[Pair]:
+        size = self.cell_size
+        cells: dict[tuple[int, int], list[int]] = {}
+        large: list[int] = []
+        candidates: set[Pair] = set()
+
+        for i, (left, right, top, bottom) in enumerate(bounds(colliders)):
+            x0, x1 = int(left // size), int(right // size)
+            y0, y1 = int(top // size), int(bottom // size)
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+                large.append(i)
+                continue
+
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cell = cells.setdefault((cx, cy), [])
+                    candidates.update((j, i) for j in cell)
+                    cell.append(i)
+
+        for i in large:
+            candidates.update((min(i, j), max(i, j)) for j in range(len(colliders)))
+            candidates.discard((i, i))
+
+        return sorted(candidates)
+
+
+class SweepAndPrune(BroadPhase):
+    """
+    Colliders are kept in a list sorted by the left edge of their x interval
+    across frames. Most actors only scroll horizontally, so the list is
+    nearly sorted every tick and an insertion sort restores it in ~O(n)
+    """
+
+    def __init__(self) -> None:
+        # [left, right, top, bottom, collider]
+        self.entries: list[list[Any]] = []
+
+    def pairs(self, colliders: Sequence[Collider]) -> Iterable[Pair]:
+        position = {collider: i for i, collider in enumerate(colliders)}
+        boxes = bounds(colliders)
+        fresh = dict(position)
+        entries: list[list[Any]] = []
+        for entry in self.entries:
+            collider = entry[4]
+            i = fresh.pop(collider, None)
+            if i is not None:
+                entry[:4] = boxes[i]
+                entries.append(entry)
+
+        for k in range(1, len(entries)):
+            entry = entries[k]
+            left = entry[0]
+            j = k
+            while j > 0 and entries[j - 1][0] > left:
+                entries[j] = entries[j - 1]
+                j -= 1
+            entries[j] = entry
+
+        # Colliders registered since the last tick
+        for collider, i in fresh.items():
+            insort(entries, [*boxes[i], collider], key=itemgetter(0))
+        self.entries = entries
+
+        candidates: list[Pair] = []
+        active: list[list[Any]] = []
+        for entry in entries:
+            left, _, top, bottom, collider = entry
+            active = [other for other in active if other[1] >= left]
+            i = position[collider]
+            for other in active:
+                if other[2] <= bottom and top <= other[3]:
+                    j = position[other[4]]
+                    candidates.append((i, j) if i < j else (j, i))
+            active.append(entry)
+
+        candidates.sort()
+        return candidates
+
+
+broad_phases: dict[str, type[BroadPhase]] = {
+    "brute-force": BruteForce,
+    "spatial-hash": SpatialHash,
+    "sweep-and-prune": SweepAndPrune,
+}
+
+
+class NarrowPhase:
+    """
+    Keep the candidate pairs that interact and whose circles actually overlap
+    """
+
+    def colliding(
+        self, colliders: Sequence[Collider], candidates: Iterable[Pair]
+    ) -> list[Pair]:
+        return [
+            (i, j)
+            for i, j in candidates
+            if colliders[i].interacts(colliders[j])
+            and colliders[i].is_colliding(colliders[j])
+        ]
+
+
+class Vectorized(NarrowPhase):
+    """
+    Batched circle test: centers and radii are gathered into contiguous
+    arrays once per frame and the pairs are checked on squared distances
+    """
+
+    def __init__(self, chunk: int = 1 << 16) -> None:
+        self.chunk = chunk
+
+    def colliding(
+        self, colliders: Sequence[Collider], candidates: Iterable[Pair]
+    ) -> list[Pair]:
+        count = len(colliders)
+        if count < 2:
+            return []
+        xy, last, radii = geometry(colliders)
+        moves = xy - last
+        categories = np.fromiter(
+            (collider.category for collider in colliders), dtype=np.int64, count=count
+        )
+        masks = np.fromiter(
+            (collider.mask for collider in colliders), dtype=np.int64, count=count
+        )
+
+        result: list[Pair] = []
+        flat = chain.from_iterable(candidates)
+        while True:
+            pairs = np.fromiter(islice(flat, 2 * self.chunk), dtype=np.intp)
+            if not pairs.size:
+                return result
+            pairs = pairs.reshape(-1, 2)
+            first, sec = pairs[:, 0], pairs[:, 1]
+            pairs = pairs[
+                (categories[first] & masks[sec]) | (categories[sec] & masks[first]) != 0
+            ]
+            first, sec = pairs[:, 0], pairs[:, 1]
+            delta = xy[first] - xy[sec]
+            # Swept circles: closest approach along the relative motion
+            motion = moves[first] - moves[sec]
+            speed = np.einsum("ij,ij->i", motion, motion)
+            swept = speed > 0
+            if swept.any():
+                motion, speed = motion[swept], speed[swept]
+                start = delta[swept] - motion
+                t = np.clip(-np.einsum("ij,ij->i", start, motion) / speed, 0.0, 1.0)
+                delta[swept] = start + motion * t[:, None]
+            reach = radii[first] + radii[sec]
+            hits = np.einsum("ij,ij->i", delta, delta) <= reach * reach
+            result.extend(map(tuple, pairs[hits].tolist()))
+
+
+def subclasses[T](cls: type[T]) -> Iterator[type[T]]:
+    yield cls
+    for sub in cls.__subclasses__():
+        yield from subclasses(sub)
+
+
+def hidden_branches() -> Iterator[str]:
+    """
+    Debug check: report every `isinstance(other, ...)` branch in an
+    `on_collision` that the collider masks would never let through
+    """
+    for cls in subclasses(Collider):
+        # Handlers up the MRO are reached through super().on_collision
+        for base in cls.__mro__:
+            if "on_collision" in base.__dict__ and base is not Collider:
+                yield from _hidden_branches(cls, base.__dict__["on_collision"])
+
+
+def _hidden_branches(cls: type[Collider], handler: FunctionType) -> Iterator[str]:
+    tree = ast.parse(dedent(inspect.getsource(handler)))
+    imported: dict[str, object] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            module = import_module(node.module)
+            for alias in node.names:
+                imported[alias.asname or alias.name] = getattr(module, alias.name)
+
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "isinstance"
+            and len(node.args) == 2
+        ):
+            continue
+        kinds = node.args[1]
+        for name in kinds.elts if isinstance(kinds, ast.Tuple) else [kinds]:
+            if not isinstance(name, ast.Name):
+                continue
+            target = imported.get(name.id, handler.__globals__.get(name.id))
+            if not (isinstance(target, type) and issubclass(target, Collider)):
+                continue
+            line = handler.__code__.co_firstlineno + node.lineno - 1
+            # Same test as Collider.interacts: either mask lets the pair through
+            if not (cls.mask & target.category or target.mask & cls.category):
+                yield (
+                    f"{cls.__name__}.on_collision handles {target.__name__}"
+                    f" ({handler.__module__}.py:{line})"
+                    f" but neither mask lets {target.category!r} through"
+                )
@@ -1,3 +1,37 @@
 BACKGROUND: str = "black"
 RESOLUTION: tuple[int, int] = 1280, 720
+# Frames drawn per second, and fixed simulation steps per second. When
+# drawing falls behind, at most MAX_STEPS steps run per frame and the game
+# slows down rather than spiralling
 FPS: int = 60
+SIM_RATE: int = 60
+MAX_STEPS: int = 5
+# Draw movers between their last two simulation steps
+INTERPOLATE: bool = True
+BROAD_PHASE: str = "spatial-hash"  # brute-force | spatial-hash | sweep-and-prune
+RENDERER: str = "full"  # full | dirty-rects
+# With dirty rects, frames between two backdrop scroll steps
+SCROLL_EVERY: int = 4
+# Rotated sprites: angle steps per turn and cache budget
+ROTATION_STEPS: int = 180
+ROTATION_CACHE_BYTES: int = 64 << 20
+# Scaled sprites: size rounding for random sizes, and scaling at startup
+SCALE_BUCKET: int = 8
+WARM_SCALES: bool = True
+# Stars per pixel column on the farthest background layer
+STARS_DENSITY: float = 1.0
+# Channel volume headroom: single plays at 1 - gain, merged ones closer to 1
+AUDIO_MERGE_GAIN: float = 0.0
+# Sound effect channels, the first ones kept for cues such as power-ups
+AUDIO_CHANNELS: int = 16
+AUDIO_RESERVED: int = 2
+# Mixer setup per machine: frequency, sample size, channels and buffer size.
+# Smaller buffers cut latency but risk underruns on slow machines
+AUDIO_PROFILES: dict[str, tuple[int, int, int, int]] = {
+    "low-latency": (44100, -16, 2, 256),
+    "balanced": (44100, -16, 2, 512),
+    "safe": (44100, -16, 2, 2048),
+}
+AUDIO_PROFILE: str = "balanced"
+# Log the time from keypresses and collisions to the sounds they trigger
+AUDIO_LATENCY_LOG: bool = False
@@ -1,7 +1,9 @@
 from typing import Optional, Protocol
-import pygame
 from pygame.surface import Surface
-from action import Action, Collider
+from action import Action, Collider, Layer
+from assets import assets
+from body import Body
+from pool import Pooled
 from sounds import AudioBag
 
 
@@ -10,43 +12,43 @@ class Foe(Protocol):
     def xy(self) -> tuple[float, float]: ...
 
 
-class EnemyFire(Collider):
+class EnemyFire(Pooled, Body, Collider):
+    __slots__ = ("shooter", "speed", "started", "last_xy")
+    category = Layer.ENEMY_FIRE
+    mask = Layer.FOE | Layer.PLAYER | Layer.SHIELD
+    swept = True
     facet: Surface
 
     @classmethod
     def load_assets(cls) -> None:
-        cls.facet = pygame.transform.scale(
-            pygame.image.load("assets/enemy-bullet.png").convert_alpha(),
-            (12, 12),
-        )
+        cls.facet = assets.image("assets/enemy-bullet.png", (12, 12))
 
-    def __init__(self, shooter: Foe) -> None:
+    def reset(self, shooter: Foe) -> None:
         if not hasattr(EnemyFire, "facet"):
             self.load_assets()
 
+        self.attach()
+        self.last_xy = None
         self.x, self.y = shooter.xy
-        self.shooter = shooter
+        self.radius = 6.0
+        self.shooter: Optional[Foe] = shooter
         self.speed: float = 1200.0
+        self.vx = -self.speed
         self.started: bool = False
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x, self.y
-
-    @property
-    def radius(self) -> float:
-        return 6.0
+    def clear(self) -> None:
+        self.store.release(self.row)
+        self.shooter = None
 
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         return self.blit(dest=surface, src=self.facet)
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         if not self.started:
             self.started = True
             return Action.play_audio(AudioBag.explosions[0])
-        self.x -= self.speed * delta
 
-    async def on_collision(self, other: "Collider") -> Optional[Action]:
+    def on_collision(self, other: "Collider") -> Optional[Action]:
         from foe import Foe
 
         if isinstance(other, Foe):
@@ -1,38 +1,48 @@
 from typing import Optional
 from pygame import Surface
-import pygame
 from action import Action, Actor
+from assets import assets
+from pool import Pooled
 from sounds import AudioBag
+from sprites import scales
 
 
-class Explosion(Actor):
+class Explosion(Pooled, Actor):
+    __slots__ = ("x", "y", "size", "frames", "frame", "started")
     facets: list[Surface] = []
+    sizes: tuple[int, ...] = (12, 72, 120)
     z: int = 12
 
     @classmethod
     def load_assets(cls) -> None:
         cls.facets = [
-            pygame.image.load(f"assets/explosion/flash{i:02d}.png").convert_alpha()
+            assets.image(f"assets/explosion/flash{i:02d}.png")
             for i in range(9)
         ]
 
-    @property
-    def pos(self) -> tuple[int, int]:
-        return self.__pos
+    @classmethod
+    def warm(cls) -> None:
+        if not cls.facets:
+            cls.load_assets()
+        scales.warm(cls.facets, cls.sizes)
 
-    def __init__(self, *, pos: tuple[int, int], size: int) -> None:
+    def reset(self, *, pos: tuple[int, int], size: int) -> None:
         if not self.facets:
             self.load_assets()
 
-        self.facets = [
-            pygame.transform.scale(facet, (size, size)) for facet in self.facets
-        ]
+        # Shield blasts come in any size: bucket them like meteors
+        if size not in self.sizes:
+            size = scales.bucket(size)
+        # Recycled explosions keep their frames when the size matches
+        if getattr(self, "size", None) != size:
+            self.size = size
+            self.frames = [scales.scale(facet, size) for facet in self.facets]
 
-        self.__pos = pos
+        self.x, self.y = pos
         self.frame: float = 0
         self.started: bool = False
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         if not self.started:
             self.started = True
             return Action.play_audio(AudioBag.explosions[1])
@@ -41,6 +51,6 @@ class Explosion(Actor):
         if self.frame >= 9:
             return Action.remove(self)
 
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         frame = min(8, int(self.frame))
-        self.blit(dest=surface, src=self.facets[frame])
+        self.blit(dest=surface, src=self.frames[frame])
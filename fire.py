@@ -1,22 +1,27 @@
 import math
 from random import random
 from typing import Optional
-from pygame import Surface
+from pygame import Color, Surface
 import pygame
-from action import Action, Collider
-from consts import RESOLUTION
+from action import Action, Collider, Layer
+from assets import assets
+from body import Body
+from pool import Pooled
+from render import disc
 from sounds import AudioBag
+from sprites import rotations
 
 
-class Fire(Collider):
+class Fire(Pooled, Body, Collider):
+    __slots__ = ("speed", "started", "facet", "power", "delay", "last_xy", "cause")
+    category = Layer.FIRE
+    mask = Layer.FOE | Layer.FORCE_FIELD | Layer.METEOR
+    swept = True
     facets: list[Surface] = []
 
     @classmethod
     def load_assets(cls) -> None:
-        bullet = pygame.transform.scale(
-            pygame.image.load("assets/bullet.png").convert_alpha(),
-            (12, 12),
-        )
+        bullet = assets.image("assets/bullet.png", (12, 12))
         laser = Surface((24, 24), pygame.SRCALPHA)
         pygame.draw.line(laser, "red", (0, 12), (24, 12), 2)
         fake_nuke = Surface((1, 1), pygame.SRCALPHA)
@@ -31,20 +36,29 @@ class Fire(Collider):
             ]
         )
 
-    def __init__(
-        self, pos: tuple[float, float], angle: float, *, power: int, quiet: bool = False
+    def reset(
+        self,
+        pos: tuple[float, float],
+        angle: float,
+        *,
+        power: int,
+        quiet: bool = False,
+        pressed: Optional[float] = None,
     ) -> None:
         if not self.facets:
             self.load_assets()
 
+        self.attach()
+        self.last_xy = None
         self.x, self.y = pos
         self.angle = angle
         self.speed: float = 1200.0
         self.started: bool = quiet
+        self.cause = None if pressed is None else ("input", pressed)
 
         self.facet = self.facets[power]
         self.power = power
-        self._radius: float = 6.0
+        self.radius = 6.0
 
         match power:
             case 1:
@@ -52,7 +66,7 @@ class Fire(Collider):
 
             case 2 | 3:
                 self.delay = 0.0
-                self._radius = 12.0
+                self.radius = 12.0
 
             case 4:
                 self.delay = 3.0
@@ -60,33 +74,41 @@ class Fire(Collider):
             case _:
                 self.delay = 0.125
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x, self.y
+        # Moved by the body store integration; the nuke shockwave stays put
+        if power not in [4, 5]:
+            self.vx = math.cos(angle) * self.speed
+            self.vy = math.sin(angle) * self.speed
 
-    @property
-    def radius(self) -> float:
-        return self._radius
+    def clear(self) -> None:
+        self.store.release(self.row)
 
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
+        if self.power in [4, 5]:
+            alpha = max(0x00, min(0xFF, int(256 - (256.0 * self.radius / 1280.0))))
+            disc(surface, self.pos, int(self.radius), Color(0x00, 0xFF, 0xBB, alpha))
+            return
         if self.power in [2, 3]:
-            facet = pygame.transform.rotate(self.facet, -self.angle * 180 / math.pi)
+            facet = rotations.rotate(self.facet, -self.angle * 180 / math.pi)
         else:
             facet = self.facet
         self.blit(dest=surface, src=facet)
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
+        if self.started and (self.power == 0 or self.power == 2):
+            # In flight: moved by the body store integration
+            return None
+
         if self.power in [1, 3]:
             # Triple shoot
             self.power -= 1
             return Action.set(
                 Action.register(
-                    Fire(
+                    Fire.acquire(
                         self.xy, self.angle - math.pi / 12, power=self.power, quiet=True
                     )
                 ),
                 Action.register(
-                    Fire(
+                    Fire.acquire(
                         self.xy, self.angle + math.pi / 12, power=self.power, quiet=True
                     )
                 ),
@@ -96,45 +118,22 @@ class Fire(Collider):
             self.started = True
             match self.power:
                 case 2 | 3:
-                    return Action.play_audio(AudioBag.laser) if random() < 0.5 else None
+                    if random() < 0.5:
+                        return Action.play_audio(AudioBag.laser, self.cause)
 
                 case 4 | 5:
-                    return Action.play_audio(AudioBag.explosions[1])
+                    return Action.play_audio(AudioBag.explosions[1], self.cause)
 
                 case _:
-                    return Action.play_audio(AudioBag.bullet)
+                    return Action.play_audio(AudioBag.bullet, self.cause)
 
         if self.power in [4, 5]:
-            self._radius += math.sqrt(self.speed * self._radius) * 5 * delta
+            self.radius += math.sqrt(self.speed * self.radius) * 5 * delta
             if self.radius > 1280:
                 return Action.remove(self)
-            facet = Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            color = (
-                0x00,
-                0xFF,
-                0xBB,
-                max(
-                    0x00,
-                    min(
-                        0xFF,
-                        int(256 - (256.0 * self.radius / 1280.0)),
-                    ),
-                ),
-            )
-            pygame.draw.circle(facet, color, (self.radius, self.radius), self.radius)
-            self.facet = facet
             return
 
-        width, height = self.facet.get_size()
-        speed = self.speed * delta
-        dx, dy = math.cos(self.angle) * speed, math.sin(self.angle) * speed
-        self.x += dx
-        self.y += dy
-
-        if self.x > RESOLUTION[0]:
-            return Action.remove(self)
-
-    async def on_collision(self, other: "Collider") -> Optional[Action]:
+    def on_collision(self, other: "Collider") -> Optional[Action]:
         if self.power not in [4, 5]:
             from foe import Foe
             from foe_force_field import FoeForceField
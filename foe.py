@@ -2,9 +2,10 @@ import math
 from random import randint, random
 from typing import Optional
 from pygame import Surface
-import pygame
 from pygame.math import clamp
-from action import Action, Collider
+from action import Action, Collider, Layer
+from assets import assets
+from body import Body
 from consts import RESOLUTION
 from enemy_fire import EnemyFire
 from explosion import Explosion
@@ -14,7 +15,12 @@ from sounds import AudioBag
 
 
 class Foe(Collider):
+    __slots__ = ()
+    category = Layer.FOE
+    mask = Layer.FIRE | Layer.ENEMY_FIRE | Layer.SHIELD | Layer.FOE
     __inited: bool = False
+    # Average shots per second of the foes that fire
+    fire_rate: float = 1.875
 
     facet: Surface
     x: float
@@ -34,11 +40,7 @@ class Foe(Collider):
             return ShooterFoe(y, speed)
         return LaserProofFoe(y, speed) if random() < 0.25 else RocketFoe(y, speed)
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x, self.y
-
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         from shield import Shield
 
         if isinstance(other, (Fire, EnemyFire, Shield)):
@@ -53,7 +55,7 @@ class Foe(Collider):
 
             if self.hp <= 0:
                 actions = [
-                    Action.register(Explosion(pos=self.pos, size=72)),
+                    Action.register(Explosion.acquire(pos=self.pos, size=72)),
                     Action.remove(self),
                 ]
                 if isinstance(other, Fire):
@@ -72,40 +74,37 @@ class Foe(Collider):
                 other.dy = -100
 
 
-class RocketFoe(Foe):
+class RocketFoe(Body, Foe):
+    __slots__ = ("dx", "dy", "hp", "sensor")
+    mask = Foe.mask | Layer.METEOR
 
     def __new__(cls, y: float, speed: float) -> "Foe":
         return Collider.__new__(cls)
 
     @classmethod
     def load_assets(cls) -> None:
-        cls.facet = pygame.transform.scale(
-            pygame.image.load("assets/foe-1.png").convert_alpha(),
-            (64, 40),
-        )
+        cls.facet = assets.image("assets/foe-1.png", (64, 40))
 
     def __init__(self, y: float, speed: float) -> None:
-        self.x: float = RESOLUTION[0]
+        self.attach()
+        self.x = RESOLUTION[0]
         self.y = y
+        self.radius = 32
         self.dx = speed
+        self.vx = -speed
         self.dy: float = 0.0
         self.hp: int = 3
         self.sensor: FoeSensor | None = None
 
-    @property
-    def radius(self) -> float:
-        return 32
-
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         self.blit(dest=surface, src=self.facet)
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         if self.sensor is None:
             self.sensor = FoeSensor(self)
             return Action.register(self.sensor)
 
-        self.x -= self.dx * delta
-        self.y += clamp(self.dy, -100, 100) * delta
+        self.vy = clamp(self.dy, -100, 100)
         self.dy -= self.dy * delta
 
     def remove_self(self) -> Action:
@@ -114,84 +113,82 @@ class RocketFoe(Foe):
             action = Action.set(action, Action.remove(self.sensor))
         return action
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         from meteor import Meteor
 
         if isinstance(other, Meteor):
             return Action.set(
                 self.remove_self(),
-                Action.register(Explosion(pos=other.pos, size=72)),
+                Action.register(Explosion.acquire(pos=other.pos, size=72)),
                 Action.play_audio(AudioBag.explosions[0]),
             )
-        return await super().on_collision(other)
+        return super().on_collision(other)
 
 
 class ShooterFoe(Foe):
+    __slots__ = ("x", "y", "course", "max_hp", "hp", "dx", "dy", "osc", "r")
+    mask = Foe.mask | Layer.PLAYER
     z: int = 10
+    radius: float = 37.5
 
     def __new__(cls, y: float, speed: float) -> Foe:
         return Collider.__new__(cls)
 
     @classmethod
     def load_assets(cls) -> None:
-        cls.facet = pygame.transform.scale(
-            pygame.image.load("assets/foe-2.png").convert_alpha(),
-            (75, 100),
-        )
+        cls.facet = assets.image("assets/foe-2.png", (75, 100))
 
     def __init__(self, y: float, speed: float) -> None:
-        self.x: float = RESOLUTION[0]
+        self.course: float = RESOLUTION[0]
+        self.x = self.course
         self.y = y
         self.max_hp = self.hp = 10 + randint(0, 4)
         self.dx = speed
         self.dy: float = 0.0
         self.osc: float = 0.0
-        self.r = 2 - random() * 4
+        # Vertical bob amplitude, in pixels per second
+        self.r = (2 - random() * 4) * 60
 
     @property
     def f(self) -> float:
         return 1.0 - self.hp / self.max_hp
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x + math.sin(self.osc) * self.f * 48, self.y
-
-    @property
-    def radius(self) -> float:
-        return 37.5
-
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         self.blit(dest=surface, src=self.facet)
 
-    async def update(self, delta: float) -> Optional[Action]:
-        self.x -= self.dx * delta
+    def update(self, delta: float) -> Optional[Action]:
+        self.course -= self.dx * delta
         self.dx -= self.dx * delta / 2
-        self.y += math.sin(self.dy) * self.r
+        self.y += math.sin(self.dy) * self.r * delta
         self.dy += delta
         self.osc += 10 * self.f * delta
+        # Wobbles around its course as it gets damaged
+        self.x = self.course + math.sin(self.osc) * self.f * 48
 
-        if random() < 0.03125:
+        if random() < self.fire_rate * delta:
             from enemy_fire import EnemyFire
 
-            return Action.register(EnemyFire(self))
+            return Action.register(EnemyFire.acquire(self))
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         if isinstance(other, EnemyFire) and other.shooter is self:
             return
         from player import Player
 
         if isinstance(other, Player):
             return Action.remove(self)
-        return await super().on_collision(other)
+        return super().on_collision(other)
 
 
 class LaserProofFoe(RocketFoe):
+    __slots__ = ("idx", "facet")
+    mask = RocketFoe.mask | Layer.PLAYER
     facets: list[Surface] = []
 
     @classmethod
     def load_assets(cls) -> None:
         cls.facets = [
-            pygame.image.load(f"assets/foe-3/{idx}.png").convert_alpha()
+            assets.image(f"assets/foe-3/{idx}.png")
             for idx in range(12)
         ]
 
@@ -201,34 +198,30 @@ class LaserProofFoe(RocketFoe):
         self.facet = self.facets[0]
         self.hp: int = 1
 
-    @property
-    def radius(self) -> float:
-        return 32
-
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         self.idx += delta * 10
         self.facet = self.facets[int(self.idx) % 12]
         actions: list[Action] = []
-        if action := await super().update(delta):
+        if action := super().update(delta):
             actions.append(action)
 
-        if random() < 0.03125:
+        if random() < self.fire_rate * delta:
             from enemy_fire import EnemyFire
 
-            actions.append(Action.register(EnemyFire(self)))
+            actions.append(Action.register(EnemyFire.acquire(self)))
 
         if actions:
             return Action.set(*actions)
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         if isinstance(other, Fire) and other.power in [2, 3]:
             from foe_force_field import FoeForceField
 
-            return Action.register(FoeForceField(self.xy, self.dx))
+            return Action.register(FoeForceField.acquire(self.xy, self.dx))
         if isinstance(other, EnemyFire) and other.shooter is self:
             return
         from player import Player
 
         if isinstance(other, Player):
             return self.remove_self()
-        return await super().on_collision(other)
+        return super().on_collision(other)
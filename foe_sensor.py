@@ -1,5 +1,6 @@
 from typing import Protocol
-from action import Collider
+from action import Collider, Layer
+from consts import SIM_RATE
 
 
 class Foe(Protocol):
@@ -9,18 +10,26 @@ class Foe(Protocol):
 
 
 class FoeSensor(Collider):
+    __slots__ = ("foe",)
+    category = Layer.SENSOR
+    mask = Layer.FOE | Layer.METEOR | Layer.PLAYER
+    radius: float = 100
+    # Change of the foe dy per second of overlap
+    steer: float = 4800.0
+
     def __init__(self, foe: Foe) -> None:
         self.foe = foe
 
+    # Derived from the foe it rides on, so it never lags behind
     @property
-    def xy(self) -> tuple[float, float]:
-        return self.foe.x - 100, self.foe.y
+    def x(self) -> float:
+        return self.foe.x - 100
 
     @property
-    def radius(self) -> float:
-        return 100
+    def y(self) -> float:
+        return self.foe.y
 
-    async def on_collision(self, other: Collider) -> None:
+    def on_collision(self, other: Collider) -> None:
         if other is self.foe:
             return
 
@@ -29,7 +38,9 @@ class FoeSensor(Collider):
         from meteor import Meteor
 
         if isinstance(other, (Foe, Meteor, Player)):
-            dy = 80 if isinstance(other, Player) else -80
+            dy = self.steer / SIM_RATE
+            if not isinstance(other, Player):
+                dy = -dy
             _, y = other.xy
             if y < self.foe.y:
                 self.foe.dy -= dy
@@ -1,30 +1,32 @@
+from time import perf_counter
 import pygame
 from pygame.event import Event
-from pygame.font import Font
 from pygame.surface import Surface
 from action import Actor
+from hud import Readout
 
 
 class FpsDisplay(Actor):
+    __slots__ = ("readout", "present", "last")
     z: int = 20
 
     def __init__(self) -> None:
-        self.font = Font("assets/digital-7.ttf", 24)
-        self.text = "FPS: 0.0"
+        self.readout = Readout("FPS: ", 6)
+        self.readout.update("0.0")
         self.present = False
+        self.last = perf_counter()
 
-    async def update(self, delta: float) -> None:
-        fps = 1 / delta
-        self.text = f"FPS: {fps:.1f}"
-
-    async def react(self, events: list[Event]) -> None:
+    def react(self, events: list[Event]) -> None:
         for event in events:
             if event.type == pygame.KEYUP and event.key == pygame.K_F2:
                 self.present = not self.present
                 return
 
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
+        # Measured between draws: updates run at the fixed simulation rate
+        last, self.last = self.last, perf_counter()
         if self.present:
-            text = self.font.render(self.text, True, "white")
-            x = surface.get_width() - text.get_width() - 5
-            surface.blit(text, (x, 5))
+            self.readout.update(f"{1 / (self.last - last):.1f}")
+            readout = self.readout
+            x = surface.get_width() - readout.area.width - 5
+            surface.blit(readout.surface, (x, 5), readout.area)
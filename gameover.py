@@ -1,16 +1,19 @@
 import pygame
-from pygame.font import Font
 from pygame.surface import Surface
 from action import Actor
+from assets import assets
 from consts import RESOLUTION
 
 
 class GameOver(Actor):
+    __slots__ = ("font", "aux_font", "facet")
     z: int = 20
+    x: float = RESOLUTION[0] / 2
+    y: float = RESOLUTION[1] / 2
 
     def __init__(self) -> None:
-        self.font = Font("assets/game-over.ttf", 120)
-        self.aux_font = Font("assets/digital-7.ttf", 24)
+        self.font = assets.font("assets/game-over.ttf", 120)
+        self.aux_font = assets.font("assets/digital-7.ttf", 24)
         self.populate()
 
     def populate(self) -> None:
@@ -28,9 +31,5 @@ class GameOver(Actor):
         text = self.font.render("Game Over", True, "#aa0000")
         facet.blit(text, (0, 0))
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return RESOLUTION[0] / 2, RESOLUTION[1] / 2
-
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         self.blit(dest=surface, src=self.facet)
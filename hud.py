@@ -0,0 +1,97 @@
+from typing import Optional
+import pygame
+from pygame import Rect, Surface
+from pygame.font import Font
+from assets import assets
+
+
+DIGITS = "0123456789 .-"
+
+
+class Atlas:
+    """
+    Glyphs of `charset` pre-rendered side by side on a single surface, so
+    text made of them is composed with area blits instead of Font.render
+    """
+
+    def __init__(self, font: Font, color: str, charset: str = DIGITS) -> None:
+        glyphs = [font.render(char, True, color) for char in charset]
+        self.height = max(glyph.get_height() for glyph in glyphs)
+        self.advance = max(glyph.get_width() for glyph in glyphs)
+        self.surface = Surface(
+            (sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA
+        )
+        self.rects: dict[str, Rect] = {}
+        x = 0
+        for char, glyph in zip(charset, glyphs):
+            self.surface.blit(glyph, (x, 0))
+            self.rects[char] = Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+    def render(self, dest: Surface, text: str, pos: tuple[int, int]) -> int:
+        """
+        Blit `text` at `pos` and return where it ends
+        """
+        x, y = pos
+        for char in text:
+            rect = self.rects[char]
+            dest.blit(self.surface, (x, y), rect)
+            x += rect.width
+        return x
+
+
+atlases: dict[tuple[str, int, str], tuple[Font, Atlas]] = {}
+
+
+def atlas(path: str, size: int, color: str) -> tuple[Font, Atlas]:
+    """
+    Font and digit atlas shared by every readout with the same style
+    """
+    key = path, size, color
+    if key not in atlases:
+        font = assets.font(path, size)
+        atlases[key] = font, Atlas(font, color)
+    return atlases[key]
+
+
+class Readout:
+    """
+    Fixed label followed by a number, composed into a cached surface that
+    is only redrawn when the number text changes, and widened when it
+    outgrows `chars`
+    """
+
+    def __init__(
+        self,
+        label: str,
+        chars: int,
+        *,
+        path: str = "assets/digital-7.ttf",
+        size: int = 24,
+        color: str = "white",
+    ) -> None:
+        font, self.atlas = atlas(path, size, color)
+        self.label = font.render(label, True, color)
+        self.allocate(chars)
+        self.text: Optional[str] = None
+        self.area = Rect(0, 0, 0, self.atlas.height)
+
+    def allocate(self, chars: int) -> None:
+        self.chars = chars
+        self.surface = Surface(
+            (self.label.get_width() + self.atlas.advance * chars, self.atlas.height),
+            pygame.SRCALPHA,
+        )
+
+    def update(self, text: str) -> None:
+        if text == self.text:
+            return
+        self.text = text
+        if len(text) > self.chars:
+            # Longer than planned: grow rather than clip
+            self.allocate(len(text))
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(self.label, (0, 0))
+        self.area.width = self.atlas.render(
+            self.surface, text, (self.label.get_width(), 0)
+        )
@@ -2,6 +2,7 @@ from typing import Protocol
 import pygame
 from pygame.surface import Surface
 from action import Actor
+from assets import assets
 from consts import RESOLUTION
 
 
@@ -10,15 +11,13 @@ class App(Protocol):
 
 
 class Lives(Actor):
+    __slots__ = ("app", "max", "width", "height", "strip", "shown")
     facet: Surface
     z: int = 20
 
     @classmethod
     def load_assets(cls) -> None:
-        cls.facet = pygame.transform.scale(
-            pygame.image.load("assets/player.png").convert_alpha(),
-            (32, 32),
-        )
+        cls.facet = assets.image("assets/player.png", (32, 32))
 
     def __init__(self, app: App) -> None:
         if not hasattr(Lives, "facet"):
@@ -26,11 +25,16 @@ class Lives(Actor):
         self.app = app
         self.max: int = self.app.lives - 1
         self.width, self.height = self.facet.get_size()
+        self.strip = Surface((self.width * self.max, self.height), pygame.SRCALPHA)
+        self.shown: int = 0
 
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         extra_lifes = self.app.lives - 1
+        if extra_lifes != self.shown:
+            # Icons are only laid out again when a life is lost
+            self.shown = extra_lifes
+            self.strip.fill((0, 0, 0, 0))
+            for i in range(min(extra_lifes, self.max)):
+                self.strip.blit(self.facet, (i * self.width, 0))
         if extra_lifes > 0:
-            facet = Surface((self.width * self.max, self.height), pygame.SRCALPHA)
-            for i in range(extra_lifes):
-                facet.blit(self.facet, (i * self.width, 0))
-            surface.blit(facet, (5, RESOLUTION[1] - self.height - 5.0))
+            surface.blit(self.strip, (5, RESOLUTION[1] - self.height - 5.0))
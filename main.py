@@ -1,6 +1,5 @@
-import asyncio
 from app import App
 
 
 if __name__ == "__main__":
-    asyncio.run(App().start())
+    App().start()
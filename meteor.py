@@ -2,68 +2,74 @@ import math
 from random import choice
 from typing import Optional
 from pygame import Surface
-import pygame
-from action import Action, Collider
+from action import Action, Collider, Layer
+from assets import assets
+from body import Body
 from consts import RESOLUTION
 from explosion import Explosion
 from fire import Fire
 from foe import RocketFoe
 from sounds import AudioBag
+from sprites import rotations, scales
 
 
-class Meteor(Collider):
+class Meteor(Body, Collider):
+    __slots__ = ("facet", "size", "speed", "rotation")
+    category = Layer.METEOR
+    mask = Layer.FIRE | Layer.FOE
     facets: list[Surface] = []
+    min_size: int = 24
+    max_size: int = 200
 
     @classmethod
     def load_assets(cls) -> None:
         cls.facets = [
-            pygame.image.load(f"assets/meteors/meteor{i}.png").convert_alpha()
+            assets.image(f"assets/meteors/meteor{i}.png")
             for i in range(1, 5)
         ]
 
+    @classmethod
+    def warm(cls) -> None:
+        if not cls.facets:
+            cls.load_assets()
+        sizes = {scales.bucket(size) for size in range(cls.min_size, cls.max_size + 1)}
+        scales.warm(cls.facets, sorted(sizes))
+
     def __init__(self, y: float, speed: float, size: int, rotation: float) -> None:
         if not self.facets:
             self.load_assets()
-        self.facet: Surface = pygame.transform.scale(choice(self.facets), (size, size))
+        size = scales.bucket(size)
+        self.facet: Surface = scales.scale(choice(self.facets), size)
 
-        self.x: float = RESOLUTION[0] + self.facet.get_width()
-        self.y: float = y
+        self.attach()
+        self.x = RESOLUTION[0] + self.facet.get_width()
+        self.y = y
+        self.radius = size / 2.0
         self.size = size
         self.speed: float = speed
-        self.angle: float = 0.0
         self.rotation = rotation
+        self.vx = -speed
+        self.spin = rotation
 
-    @property
-    def radius(self) -> float:
-        return self.size / 2.0
-
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x, self.y
-
-    async def update(self, delta: float) -> None:
-        self.x -= self.speed * delta
-        self.angle += self.rotation * delta
-
-    async def draw(self, surface: Surface) -> None:
-        facet = pygame.transform.rotate(self.facet, self.angle * 180 / math.pi)
+    def draw(self, surface: Surface) -> None:
+        facet = rotations.rotate(self.facet, self.angle * 180 / math.pi)
         self.blit(dest=surface, src=facet)
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         if (
             isinstance(other, Fire)
             and other.power in [0, 1]
             or isinstance(other, RocketFoe)
         ):
             return Action.set(
-                Action.register(Explosion(pos=other.pos, size=72)),
+                Action.register(Explosion.acquire(pos=other.pos, size=72)),
                 Action.play_audio(AudioBag.explosions[0]),
             )
 
         if isinstance(other, Fire) and other.power == 5:
             return Action.set(
                 Action.remove(self),
-                Action.register(Explosion(pos=other.pos, size=72)),
+                Action.register(Explosion.acquire(pos=other.pos, size=72)),
                 Action.play_audio(AudioBag.explosions[0]),
                 Action.incr_score(10),
             )
@@ -1,15 +1,18 @@
 import pygame
-from pygame.font import Font
 from pygame.surface import Surface
 from action import Actor
+from assets import assets
 from consts import RESOLUTION
 
 
 class Paused(Actor):
+    __slots__ = ("font", "facet")
     z: int = 20
+    x: float = RESOLUTION[0] / 2
+    y: float = RESOLUTION[1] / 2
 
     def __init__(self) -> None:
-        self.font = Font("assets/game-over.ttf", 120)
+        self.font = assets.font("assets/game-over.ttf", 120)
         self.populate()
 
     def populate(self) -> None:
@@ -21,9 +24,5 @@ class Paused(Actor):
         text: Surface = self.font.render("Paused", True, "#00aaff")
         facet.blit(text, (0, 0))
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return RESOLUTION[0] / 2, RESOLUTION[1] / 2
-
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         self.blit(dest=surface, src=self.facet)
@@ -1,9 +1,11 @@
 import math
+from time import monotonic
 from typing import Optional
 import pygame
 from pygame import Surface
 from pygame.event import Event
-from action import Action, Collider
+from action import Action, Collider, Layer
+from assets import assets
 from consts import RESOLUTION
 from enemy_fire import EnemyFire
 from explosion import Explosion
@@ -13,25 +15,44 @@ from foe_force_field import FoeForceField
 from meteor import Meteor
 from shield import Shield
 from sounds import AudioBag
-from util import async_gen
+from sprites import rotations
 
 
 class Player(Collider):
+    __slots__ = (
+        "keys",
+        "speed",
+        "no_fire",
+        "x",
+        "y",
+        "dx",
+        "dy",
+        "dangle",
+        "angle",
+        "_power",
+        "previous_power",
+        "shots",
+        "shield",
+        "may_spawn_shield",
+        "pressed",
+    )
+    category = Layer.PLAYER
+    mask = (
+        Layer.ENEMY_FIRE | Layer.FOE | Layer.FORCE_FIELD | Layer.METEOR | Layer.POWER_UP
+    )
     facet: Surface
+    z: int = 10
+    radius: float = 28
 
     @classmethod
     def load_assets(cls) -> None:
-        cls.facet = pygame.transform.scale(
-            pygame.image.load("assets/player.png").convert_alpha(),
-            (64, 64),
-        )
+        cls.facet = assets.image("assets/player.png", (64, 64))
 
     def __init__(self) -> None:
         if not hasattr(Player, "facet"):
             Player.load_assets()
 
         pygame.display.set_icon(self.facet)
-        self.z = 10
         self.keys: list[bool] = [False] * 5
         self.speed: float = 400.0
         self.no_fire = 0.0
@@ -46,14 +67,8 @@ class Player(Collider):
         self.shots: int = 0
         self.shield: Optional[Shield] = None
         self.may_spawn_shield: float = 0.0
-
-    @property
-    def radius(self) -> float:
-        return 28
-
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x, self.y
+        # When fire was pressed, until the shot it causes
+        self.pressed: Optional[float] = None
 
     @property
     def power(self) -> int:
@@ -68,14 +83,11 @@ class Player(Collider):
         self.no_fire = 0.0
         self._power = value
 
-    async def draw(self, surface: Surface) -> None:
-        facet = pygame.transform.rotate(
-            self.facet,
-            -self.angle * 180 / math.pi,
-        )
+    def draw(self, surface: Surface) -> None:
+        facet = rotations.rotate(self.facet, -self.angle * 180 / math.pi)
         self.blit(dest=surface, src=facet)
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         self.no_fire = max([0, self.no_fire - delta])
         self.x += self.speed * self.dx * delta
         self.y += self.speed * self.dy * delta
@@ -89,7 +101,10 @@ class Player(Collider):
             actions.append(Action.spawn_shield())
 
         if self.keys[4] and self.no_fire == 0:
-            fire = Fire(self.xy, self.angle, power=self.power)
+            fire = Fire.acquire(
+                self.xy, self.angle, power=self.power, pressed=self.pressed
+            )
+            self.pressed = None
             self.no_fire = fire.delay
             actions.append(Action.register(fire))
             if self.power == 4:
@@ -104,8 +119,8 @@ class Player(Collider):
         elif actions:
             return Action.set(*actions)
 
-    async def react(self, events: list[Event]) -> None:
-        async for event in async_gen(ev for ev in events if ev.type == pygame.KEYUP):
+    def react(self, events: list[Event]) -> None:
+        for event in (ev for ev in events if ev.type == pygame.KEYUP):
             match event.key:
                 case pygame.K_UP | pygame.K_w:
                     self.keys[0] = False
@@ -118,7 +133,7 @@ class Player(Collider):
                 case pygame.K_SPACE | pygame.K_LCTRL:
                     self.keys[4] = False
 
-        async for event in async_gen(ev for ev in events if ev.type == pygame.KEYDOWN):
+        for event in (ev for ev in events if ev.type == pygame.KEYDOWN):
             match event.key:
                 case pygame.K_UP | pygame.K_w:
                     self.keys[0] = True
@@ -130,6 +145,7 @@ class Player(Collider):
                     self.keys[3] = True
                 case pygame.K_SPACE | pygame.K_LCTRL:
                     self.keys[4] = True
+                    self.pressed = monotonic()
 
         self.dx = self.dy = self.dangle = 0
         if self.keys[0]:
@@ -143,11 +159,11 @@ class Player(Collider):
         if self.keys[3]:
             self.dx += 1
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         if isinstance(other, (EnemyFire, Foe, FoeForceField, Meteor)):
             actions = [
                 Action.remove(self),
-                Action.register(Explosion(pos=self.pos, size=120)),
+                Action.register(Explosion.acquire(pos=self.pos, size=120)),
                 Action.player_hit(),
             ]
             if self.shield:
@@ -165,7 +181,7 @@ class Player(Collider):
                 self.power = 4
 
             elif other.power == 5:
-                return Action.register(Fire(self.pos, 0, power=5))
+                return Action.register(Fire.acquire(self.pos, 0, power=5))
 
             elif other.power == PowerUp.shield:
                 old = self.shield
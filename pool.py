@@ -0,0 +1,77 @@
+from typing import Any, Self
+
+
+class Pool:
+    """
+    Free list of released instances of a pooled actor class
+    """
+
+    def __init__(self, cls: type["Pooled"], capacity: int = 256) -> None:
+        self.cls = cls
+        self.capacity = capacity
+        self.free: list[Pooled] = []
+        self.created: int = 0
+        self.reused: int = 0
+        self.released: int = 0
+        self.dropped: int = 0
+
+    def acquire(self, *args: Any, **kwargs: Any) -> "Pooled":
+        if self.free:
+            instance = self.free.pop()
+            instance.reset(*args, **kwargs)
+            self.reused += 1
+            return instance
+        return self.cls(*args, **kwargs)
+
+    def release(self, instance: "Pooled") -> None:
+        instance.clear()
+        if len(self.free) < self.capacity:
+            self.free.append(instance)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "dropped": self.dropped,
+            "free": len(self.free),
+            "capacity": self.capacity,
+        }
+
+
+pools: dict[str, Pool] = {}
+
+
+class Pooled:
+    """
+    Mixin for actors recycled through a pool. Instances are obtained with
+    `acquire`, which takes the constructor arguments; `reset` must set up
+    every field from those arguments and `clear` drops whatever the actor
+    holds once it leaves the world
+    """
+
+    __slots__ = ()
+    pool: Pool
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.pool = pools[cls.__name__] = Pool(cls)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.pool.created += 1
+        self.reset(*args, **kwargs)
+
+    @classmethod
+    def acquire(cls, *args: Any, **kwargs: Any) -> Self:
+        return cls.pool.acquire(*args, **kwargs)  # type: ignore
+
+    def release(self) -> None:
+        self.pool.release(self)
+
+    def reset(self, *args: Any, **kwargs: Any) -> None: ...
+
+    def clear(self) -> None: ...
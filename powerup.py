@@ -3,28 +3,41 @@ from typing import Literal, Optional
 
 from pygame import Surface
 import pygame
-from pygame.font import Font
 from pygame.mixer import Sound
-from action import Action, Collider
+from action import Action, Collider, Layer
+from assets import assets
+from body import Body
 from consts import RESOLUTION
 from player import Player
 from sounds import AudioBag
 
 
-class PowerUp(Collider):
+class PowerUp(Body, Collider):
+    __slots__ = ("facet", "power", "speed")
+    category = Layer.POWER_UP
+    mask = Layer.PLAYER
     facets: list[Surface] = []
     shield: Literal[6] = 6
 
     @classmethod
     def load_assets(cls) -> None:
-        font = Font("assets/digital-7.ttf", 48)
         for i, color in enumerate(colors):
-            facet = Surface((48, 48), pygame.SRCALPHA)
-            pygame.draw.circle(facet, color[0], (24, 24), 24)
-            text = font.render(str(i), True, color[1])
-            facet.blit(text, (text.get_width() / 2, 4))
-            cls.facets.append(facet)
-        cls.facets.append(pygame.image.load("assets/shield-badge.png"))
+            cls.facets.append(
+                assets.baked.get(
+                    ["assets/digital-7.ttf"],
+                    f"power-up:{i}:{color}",
+                    lambda i=i, color=color: cls.badge(str(i), *color),
+                )
+            )
+        cls.facets.append(assets.image("assets/shield-badge.png"))
+
+    @staticmethod
+    def badge(label: str, fill: str, ink: str) -> Surface:
+        facet = Surface((48, 48), pygame.SRCALPHA)
+        pygame.draw.circle(facet, fill, (24, 24), 24)
+        text = assets.font("assets/digital-7.ttf", 48).render(label, True, ink)
+        facet.blit(text, (text.get_width() / 2, 4))
+        return facet
 
     def __init__(self, y: float, speed: float, *, power: Optional[int] = None) -> None:
         if not self.facets:
@@ -48,25 +61,17 @@ class PowerUp(Collider):
         self.facet = self.facets[power]
         self.power = power
 
+        self.attach()
         self.x = RESOLUTION[0] + self.facet.get_width() / 2
         self.y = y
+        self.radius = 24
         self.speed = speed
+        self.vx = -speed
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return (self.x, self.y)
-
-    @property
-    def radius(self) -> float:
-        return 24
-
-    async def update(self, delta: float) -> None:
-        self.x -= self.speed * delta
-
-    async def draw(self, surface: Surface) -> None:
+    def draw(self, surface: Surface) -> None:
         return self.blit(dest=surface, src=self.facet)
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         if isinstance(other, Player):
             player: Player = other
             audio: Sound
@@ -0,0 +1,122 @@
+from itertools import chain
+from typing import Any, Iterable, Iterator
+from action import Actor, Query
+
+
+class Ordered:
+    """
+    Set of actors that keeps list order with O(1) insertion at either end
+    and O(1) removal: prepended actors come first, newest first
+    """
+
+    def __init__(self) -> None:
+        self.front: dict[Actor, None] = {}
+        self.back: dict[Actor, None] = {}
+
+    def __contains__(self, actor: Actor) -> bool:
+        return actor in self.back or actor in self.front
+
+    def __iter__(self) -> Iterator[Actor]:
+        return chain(reversed(self.front), self.back)
+
+    def __len__(self) -> int:
+        return len(self.front) + len(self.back)
+
+    def add(self, actor: Actor, first: bool = False) -> None:
+        (self.front if first else self.back)[actor] = None
+
+    def remove(self, actor: Actor) -> None:
+        if actor in self.back:
+            del self.back[actor]
+        else:
+            del self.front[actor]
+
+
+class Registry:
+    """
+    Live actors in list order, with O(1) removal and per-type indexes.
+    Indexes are built on first query and kept up to date afterwards
+    """
+
+    def __init__(self, actors: Iterable[Actor] = ()) -> None:
+        self.actors = Ordered()
+        self.types: dict[type, Ordered] = {}
+        self.keys: dict[tuple[type, str], dict[Any, Ordered]] = {}
+        self.extend(actors)
+
+    def __contains__(self, actor: Actor) -> bool:
+        return actor in self.actors
+
+    def __iter__(self) -> Iterator[Actor]:
+        return iter(self.actors)
+
+    def __len__(self) -> int:
+        return len(self.actors)
+
+    def add(self, actor: Actor, first: bool = False) -> None:
+        """
+        Append `actor`, or prepend it when `first`, as spawned actors are
+        """
+        self.actors.add(actor, first)
+        for cls, index in self.types.items():
+            if isinstance(actor, cls):
+                index.add(actor, first)
+        for (cls, attr), index in self.keys.items():
+            if isinstance(actor, cls):
+                index.setdefault(getattr(actor, attr), Ordered()).add(actor, first)
+
+    def extend(self, actors: Iterable[Actor]) -> None:
+        for actor in actors:
+            self.add(actor)
+
+    def remove(self, actor: Actor) -> None:
+        try:
+            self.actors.remove(actor)
+        except KeyError:
+            raise ValueError(f"{actor} is not registered") from None
+        for cls, index in self.types.items():
+            if isinstance(actor, cls):
+                index.remove(actor)
+        for (cls, attr), index in self.keys.items():
+            if isinstance(actor, cls):
+                index[getattr(actor, attr)].remove(actor)
+
+    def of_type[T: Actor](self, cls: type[T]) -> Iterable[T]:
+        """
+        Live instances of `cls` (subclasses included), in list order
+        """
+        index = self.types.get(cls)
+        if index is None:
+            index = self.types[cls] = Ordered()
+            for actor in self.actors:
+                if isinstance(actor, cls):
+                    index.add(actor)
+        return index  # type: ignore
+
+    def keyed[T: Actor](self, cls: type[T], attr: str, value: Any) -> Iterable[T]:
+        """
+        Live instances of `cls` whose (immutable) `attr` equals `value`
+        """
+        index = self.keys.get((cls, attr))
+        if index is None:
+            index = self.keys[cls, attr] = {}
+            for actor in self.of_type(cls):
+                index.setdefault(getattr(actor, attr), Ordered()).add(actor)
+        return index.get(value, ())  # type: ignore
+
+    def select(self, query: Query) -> list[Actor]:
+        """
+        Live actors matching `query`, gathered from the type indexes
+        """
+        if not query.types:
+            candidates: Iterable[Actor] = self.actors
+        elif len(query.types) == 1:
+            candidates = self.of_type(query.types[0])
+        else:
+            candidates = {}
+            for cls in query.types:
+                candidates.update(dict.fromkeys(self.of_type(cls)))
+        if query.rect is None:
+            return list(candidates)
+        inside = query.rect.collidepoint
+        return [actor for actor in candidates if inside(actor.x, actor.y)]
@@ -0,0 +1,196 @@
+from contextlib import contextmanager
+import inspect
+from operator import attrgetter
+from types import MemberDescriptorType
+from typing import Iterable, Iterator, Optional
+import numpy as np
+import pygame
+from pygame import Color, Rect, Surface
+import pygame.gfxdraw
+
+from action import Actor
+from body import Column, bodies
+from consts import BACKGROUND, RESOLUTION, SCROLL_EVERY
+from util import settle
+
+
+by_z = attrgetter("z")
+
+
+class Renderer:
+    """
+    Draws actors straight onto the screen, sorted by z-axis. The sort is
+    stable, so actors on the same level keep their insertion order
+    """
+
+    def __init__(self, screen: Surface) -> None:
+        self.screen = screen
+
+    def draw(self, actors: Iterable[Actor]) -> None:
+        self.screen.fill(BACKGROUND)
+        settle([actor.draw(self.screen) for actor in sorted(actors, key=by_z)])
+        pygame.display.flip()
+
+
+class Canvas(Surface):
+    """
+    Back buffer keeping track of the rects its blits touch
+    """
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        super().__init__(size)
+        self.touched: list[Rect] = []
+
+    def blit(  # type: ignore[override]
+        self,
+        source: Surface,
+        dest: tuple[float, float] | Rect,
+        area: Optional[Rect] = None,
+        special_flags: int = 0,
+    ) -> Rect:
+        rect = super().blit(source, dest, area, special_flags)
+        self.touched.append(rect)
+        return rect
+
+    def restore(self, source: Surface, rect: Rect) -> None:
+        """
+        Copy back `rect` from `source`, without tracking it
+        """
+        Surface.blit(self, source, rect, rect)
+
+
+def disc(
+    surface: Surface, center: tuple[int, int], radius: int, color: Color
+) -> None:
+    """
+    Filled circle alpha-blended straight onto `surface`
+    """
+    x, y = center
+    pygame.gfxdraw.filled_circle(surface, x, y, radius, color)
+    if isinstance(surface, Canvas):
+        size = 2 * radius + 1
+        rect = Rect(x - radius, y - radius, size, size)
+        surface.touched.append(rect.clip(surface.get_rect()))
+
+
+def ring(
+    surface: Surface, center: tuple[int, int], radius: int, color: Color, width: int
+) -> None:
+    """
+    Opaque circle outline drawn straight onto `surface`
+    """
+    rect = pygame.draw.circle(surface, color, center, radius, width)
+    if isinstance(surface, Canvas):
+        surface.touched.append(rect)
+
+
+def merge(rects: Iterable[Rect]) -> list[Rect]:
+    """
+    Union overlapping rects, dropping empty ones
+    """
+    merged: list[Rect] = []
+    for rect in rects:
+        if not rect.width or not rect.height:
+            continue
+        rect = rect.copy()
+        while (index := rect.collidelist(merged)) >= 0:
+            rect.union_ip(merged.pop(index))
+        merged.append(rect)
+    return merged
+
+
+class DirtyRects(Renderer):
+    """
+    Redraws only what changed and pushes it with `display.update`. Backdrop
+    actors are rendered into a cached surface, refreshed every `scroll_every`
+    frames with a full flip; in between, the regions actors touched on the
+    previous frame are restored from it before they draw again
+    """
+
+    def __init__(self, screen: Surface, scroll_every: int = SCROLL_EVERY) -> None:
+        super().__init__(screen)
+        self.scroll_every = scroll_every
+        self.backdrop = Surface(RESOLUTION)
+        self.canvas = Canvas(RESOLUTION)
+        self.previous: list[Rect] = []
+        self.frame: int = 0
+
+    def draw(self, actors: Iterable[Actor]) -> None:
+        actors = sorted(actors, key=by_z)
+        full = self.frame % self.scroll_every == 0
+        self.frame += 1
+        canvas = self.canvas
+        if full:
+            self.backdrop.fill(BACKGROUND)
+            settle([actor.draw(self.backdrop) for actor in actors if actor.backdrop])
+            canvas.restore(self.backdrop, canvas.get_rect())
+        else:
+            for rect in self.previous:
+                canvas.restore(self.backdrop, rect)
+        canvas.touched = []
+        settle([actor.draw(canvas) for actor in actors if not actor.backdrop])
+        if full:
+            self.screen.blit(canvas, (0, 0))
+            pygame.display.flip()
+        else:
+            dirty = merge(self.previous + canvas.touched)
+            for rect in dirty:
+                self.screen.blit(canvas, rect, rect)
+            pygame.display.update(dirty)
+        self.previous = canvas.touched
+
+
+class Interpolation:
+    """
+    Positions of the movers at the previous simulation step. While a frame
+    is drawn, each of them is placed `alpha` of the way from there to its
+    current position, then put back. Jumps longer than `snap` pixels, such
+    as respawns, are drawn as they are
+    """
+
+    snap: float = 64.0
+
+    def __init__(self) -> None:
+        # Column of each mover in `xy`
+        self.previous: dict[Actor, int] = {}
+        self.xy = np.empty((2, 0), dtype=np.float64)
+        self.movers: dict[type, bool] = {}
+
+    def moves(self, actor: Actor) -> bool:
+        """
+        Whether the actor type stores its own position, rather than sharing
+        the class default or deriving it from another actor
+        """
+        cls = type(actor)
+        if cls not in self.movers:
+            x = inspect.getattr_static(cls, "x")
+            self.movers[cls] = isinstance(x, (Column, MemberDescriptorType))
+        return self.movers[cls]
+
+    def snapshot(self, actors: Iterable[Actor]) -> None:
+        movers = [actor for actor in actors if self.moves(actor)]
+        self.previous = dict(zip(movers, range(len(movers))))
+        self.xy = bodies.gather(movers, ("x", "y"))
+
+    @contextmanager
+    def blend(self, alpha: float) -> Iterator[None]:
+        actors = list(self.previous)
+        before = self.xy[:, list(self.previous.values())]
+        after = bodies.gather(actors, ("x", "y"))
+        step = after - before
+        distance = np.abs(step).sum(axis=0)
+        blended = (distance > 0) & (distance <= self.snap)
+        moved = [actors[i] for i in np.flatnonzero(blended).tolist()]
+        if moved:
+            bodies.scatter(moved, ("x", "y"), (before + step * alpha)[:, blended])
+        try:
+            yield
+        finally:
+            if moved:
+                bodies.scatter(moved, ("x", "y"), after[:, blended])
+
+
+renderers: dict[str, type[Renderer]] = {
+    "full": Renderer,
+    "dirty-rects": DirtyRects,
+}
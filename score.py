@@ -1,7 +1,7 @@
 from typing import Protocol
-from pygame.font import Font
 from pygame.surface import Surface
 from action import Actor
+from hud import Readout
 
 
 class App(Protocol):
@@ -9,16 +9,18 @@ class App(Protocol):
 
 
 class Score(Actor):
+    __slots__ = ("app", "readout", "value")
     z: int = 20
 
     def __init__(self, app: App) -> None:
         self.app = app
-        self.font = Font("assets/digital-7.ttf", 24)
-        self.text = "Score: 0"
+        self.readout = Readout("Score: ", 5)
+        self.value: int = -1
 
-    async def update(self, delta: float) -> None:
-        self.text = f"Score: {self.app.score:5d}"
+    def update(self, delta: float) -> None:
+        if self.app.score != self.value:
+            self.value = self.app.score
+            self.readout.update(f"{self.value:5d}")
 
-    async def draw(self, surface: Surface) -> None:
-        text = self.font.render(self.text, True, "white")
-        surface.blit(text, (5, 5))
+    def draw(self, surface: Surface) -> None:
+        surface.blit(self.readout.surface, (5, 5))
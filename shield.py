@@ -1,10 +1,11 @@
 import math
 from typing import Optional, Protocol
-import pygame
 from pygame.surface import Surface
-from action import Action, Collider
-from consts import FPS
+from action import Action, Collider, Layer
+from assets import assets
+from consts import SIM_RATE
 from sounds import AudioBag
+from sprites import rotations, scales
 
 
 class Player(Protocol):
@@ -16,11 +17,14 @@ class Player(Protocol):
 
 
 class Shield(Collider):
+    __slots__ = ("player", "x", "y", "radius", "desired_size", "angle", "hp")
+    category = Layer.SHIELD
+    mask = Layer.ENEMY_FIRE | Layer.FOE | Layer.FORCE_FIELD | Layer.METEOR
     facet: Surface
 
     @classmethod
     def load_assets(cls):
-        cls.facet = pygame.image.load("assets/shield.png")
+        cls.facet = assets.image("assets/shield.png")
 
     def __init__(self, player: Player) -> None:
         if not hasattr(Shield, "facet"):
@@ -28,27 +32,18 @@ class Shield(Collider):
         self.player = player
         player.shield = self
         self.x, self.y = player.xy
-        self.size: float = 2.0
+        self.radius: float = 2.0
         self.desired_size: float = 64.0
         self.angle: float = player.angle
         self.hp: int = 10
 
-    @property
-    def xy(self) -> tuple[float, float]:
-        return self.x, self.y
-
-    @property
-    def radius(self) -> float:
-        return self.size
-
-    async def draw(self, surface: Surface) -> None:
-        facet = pygame.transform.rotate(
-            pygame.transform.scale(self.facet, (self.size * 2, self.size * 2)),
-            -self.angle * 180 / math.pi,
-        )
+    def draw(self, surface: Surface) -> None:
+        # Bucketed so the growing shield reuses a few cached rotations
+        size = scales.bucket(self.radius * 2)
+        facet = rotations.rotate(self.facet, -self.angle * 180 / math.pi, (size, size))
         return self.blit(dest=surface, src=facet)
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         tx, ty = self.player.xy
         tangle = self.player.angle
         tx += math.cos(tangle) * self.desired_size
@@ -57,9 +52,9 @@ class Shield(Collider):
         self.angle = tangle
         self.x = tx
         self.y = ty
-        self.size += (self.desired_size - self.size) * 4 * delta
+        self.radius += (self.desired_size - self.radius) * 4 * delta
 
-    async def on_collision(self, other: Collider) -> Optional[Action]:
+    def on_collision(self, other: Collider) -> Optional[Action]:
         from enemy_fire import EnemyFire
         from explosion import Explosion
         from foe import Foe
@@ -74,13 +69,15 @@ class Shield(Collider):
                 return Action.set(
                     Action.remove(self),
                     Action.play_audio(AudioBag.explosions[1]),
-                    Action.register(Explosion(pos=self.pos, size=int(self.size))),
+                    Action.register(
+                        Explosion.acquire(pos=self.pos, size=int(self.radius))
+                    ),
                 )
             else:
                 return Action.set(
                     Action.play_audio(AudioBag.explosions[0]),
-                    Action.register(Explosion(pos=self.pos, size=12)),
+                    Action.register(Explosion.acquire(pos=self.pos, size=12)),
                 )
 
         if isinstance(other, Meteor):
-            self.x -= 10 / FPS
+            self.x -= 10 / SIM_RATE
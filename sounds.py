@@ -1,20 +1,176 @@
+import sys
+from time import monotonic
+from typing import Optional
 import pygame
-from pygame.mixer import Sound
+from pygame.mixer import Channel, Sound
+from assets import assets
+from consts import (
+    AUDIO_CHANNELS,
+    AUDIO_LATENCY_LOG,
+    AUDIO_PROFILE,
+    AUDIO_PROFILES,
+    AUDIO_RESERVED,
+)
+
+
+class Latency:
+    """
+    Time from a trigger (a keypress, a collision) to the `Sound.play` call
+    of the sound it causes. Triggers travel with the `PlayAudio` action as
+    its `cause`, so sounds without one are not measured
+    """
+
+    def __init__(self, enabled: bool = AUDIO_LATENCY_LOG) -> None:
+        self.enabled = enabled
+        self.buffer: float = 0.0
+        self.samples: dict[str, list[float]] = {}
+
+    def played(self, cause: tuple[str, float], now: float) -> None:
+        kind, at = cause
+        delay = now - at
+        self.samples.setdefault(kind, []).append(delay)
+        print(
+            f"audio latency: {kind} to play {delay * 1000:.1f} ms"
+            f" (+{self.buffer * 1000:.1f} ms mixer buffer)",
+            file=sys.stderr,
+        )
+
+    @property
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {
+            kind: {
+                "count": len(samples),
+                "mean": sum(samples) / len(samples),
+                "max": max(samples),
+            }
+            for kind, samples in self.samples.items()
+        }
+
+
+class Voices:
+    """
+    Channel pool for sound effects. Each sound has a priority and a minimum
+    interval between two plays. The first `reserved` channels only take
+    sounds of priority `cue` and above; when every channel is busy, the
+    oldest voice of the lowest priority not above the new one is stolen
+    """
+
+    cue: int = 2
+
+    def __init__(
+        self, channels: int = AUDIO_CHANNELS, reserved: int = AUDIO_RESERVED
+    ) -> None:
+        pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(reserved)
+        self.reserved = reserved
+        self.channels = [Channel(i) for i in range(channels)]
+        # Priority and start time of the last voice of each channel
+        self.voices: list[tuple[int, float]] = [(0, 0.0)] * channels
+        self.settings: dict[Sound, tuple[int, float]] = {}
+        self.last: dict[Sound, float] = {}
+        self.latency = Latency()
+        self.played: int = 0
+        self.stolen: int = 0
+        self.throttled: int = 0
+        self.dropped: int = 0
+
+    def configure(self, sound: Sound, priority: int = 0, interval: float = 0.0) -> None:
+        self.settings[sound] = priority, interval
+
+    def play(
+        self,
+        sound: Sound,
+        volume: float = 1.0,
+        cause: Optional[tuple[str, float]] = None,
+    ) -> Optional[Channel]:
+        priority, interval = self.settings.get(sound, (0, 0.0))
+        now = monotonic()
+        if now - self.last.get(sound, -interval) < interval:
+            self.throttled += 1
+            return None
+
+        first = 0 if priority >= self.cue else self.reserved
+        index = self.idle(first)
+        if index is None:
+            index = self.victim(first, priority)
+            if index is None:
+                self.dropped += 1
+                return None
+            self.stolen += 1
+
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self.voices[index] = priority, now
+        self.last[sound] = now
+        self.played += 1
+        if cause is not None and self.latency.enabled:
+            self.latency.played(cause, monotonic())
+        return channel
+
+    def idle(self, first: int) -> Optional[int]:
+        for index in range(first, len(self.channels)):
+            if not self.channels[index].get_busy():
+                return index
+        return None
+
+    def victim(self, first: int, priority: int) -> Optional[int]:
+        voices = self.voices
+        candidates = [i for i in range(first, len(voices)) if voices[i][0] <= priority]
+        return min(candidates, key=voices.__getitem__, default=None)
+
+    @property
+    def active(self) -> int:
+        return sum(channel.get_busy() for channel in self.channels)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "active": self.active,
+            "played": self.played,
+            "stolen": self.stolen,
+            "throttled": self.throttled,
+            "dropped": self.dropped,
+        }
 
 
 class AudioBag:
     bullet: Sound
     explosions: list[Sound]
+    voices: Voices
+    profile: str = AUDIO_PROFILE
+
+    @classmethod
+    def pre_init(cls, profile: str = AUDIO_PROFILE) -> None:
+        """
+        Mixer settings, to be given before `pygame.init`
+        """
+        cls.profile = profile
+        pygame.mixer.pre_init(*AUDIO_PROFILES[profile])
 
     @classmethod
     def init(cls) -> None:
-        pygame.mixer.init()
-        cls.bullet = Sound("assets/missile.wav")
-        cls.catch = Sound("assets/catch.wav")
+        """
+        Load the sound effects, once the mixer is initialized
+        """
+        cls.bullet = assets.sound("assets/missile.wav")
+        cls.catch = assets.sound("assets/catch.wav")
         cls.explosions = [
-            Sound("assets/explosion1.wav"),
-            Sound("assets/explosion2.wav"),
+            assets.sound("assets/explosion1.wav"),
+            assets.sound("assets/explosion2.wav"),
         ]
-        cls.laser = Sound("assets/laser.wav")
-        cls.power_down = Sound("assets/power-down.wav")
-        cls.power_up = Sound("assets/power-up.wav")
+        cls.laser = assets.sound("assets/laser.wav")
+        cls.power_down = assets.sound("assets/power-down.wav")
+        cls.power_up = assets.sound("assets/power-up.wav")
+
+        voices = cls.voices = Voices()
+        voices.configure(cls.bullet, 0, 0.04)
+        voices.configure(cls.laser, 0, 0.04)
+        for explosion in cls.explosions:
+            voices.configure(explosion, 1, 0.05)
+        voices.configure(cls.catch, Voices.cue)
+        voices.configure(cls.power_down, Voices.cue)
+        voices.configure(cls.power_up, Voices.cue)
+
+        frequency, _, _ = pygame.mixer.get_init()
+        voices.latency.buffer = AUDIO_PROFILES[cls.profile][3] / frequency
@@ -9,12 +9,14 @@ from powerup import PowerUp
 
 
 class FoeSpawner(Actor):
+    __slots__ = ("wait_time", "max_wait_time", "reset")
+
     def __init__(self) -> None:
         self.wait_time: float = 0.0
         self.max_wait_time: float = 5.0
         self.reset: float | None = None
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         self.wait_time -= delta
         self.wait_time = max(0.0, self.wait_time)
 
@@ -37,16 +39,18 @@ class FoeSpawner(Actor):
 
 
 class MeteorSpawner(Actor):
+    __slots__ = ("wait_time", "max_wait_time")
+
     def __init__(self) -> None:
         self.wait_time: float = 10.0
         self.max_wait_time: float = 20.0
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         self.wait_time -= delta
         self.wait_time = max(0.0, self.wait_time)
         if self.wait_time == 0:
             self.wait_time = random() * self.max_wait_time
-            size: int = randint(24, 200)
+            size: int = randint(Meteor.min_size, Meteor.max_size)
             speed = 50 + random() * 50
             rotation = math.pi - random() * math.tau
             y = randint(0, RESOLUTION[1])
@@ -54,12 +58,14 @@ class MeteorSpawner(Actor):
 
 
 class PowerUpSpawner(Actor):
+    __slots__ = ("min_wait_time", "max_wait_time", "wait_time")
+
     def __init__(self) -> None:
         self.min_wait_time: float = 10.0
         self.max_wait_time: float = 20.0
         self.wait_time: float = self.min_wait_time
 
-    async def update(self, delta: float) -> Optional[Action]:
+    def update(self, delta: float) -> Optional[Action]:
         self.wait_time -= delta
         self.wait_time = max(0.0, self.wait_time)
         if self.wait_time == 0:
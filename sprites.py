@@ -0,0 +1,120 @@
+from typing import Iterable, Optional
+import pygame
+from pygame import Surface
+
+from consts import ROTATION_CACHE_BYTES, ROTATION_STEPS, SCALE_BUCKET
+
+
+class RotationCache:
+    """
+    Rotated, and optionally scaled, copies of source surfaces. Angles are
+    quantized to `steps` per turn, and the least recently used copies are
+    evicted once they take more than `max_bytes`
+    """
+
+    def __init__(
+        self, steps: int = ROTATION_STEPS, max_bytes: int = ROTATION_CACHE_BYTES
+    ) -> None:
+        self.steps = steps
+        self.max_bytes = max_bytes
+        self.entries: dict[tuple[Surface, int, Optional[tuple[int, int]]], Surface] = {}
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def rotate(
+        self, source: Surface, degrees: float, size: Optional[tuple[int, int]] = None
+    ) -> Surface:
+        """
+        Same as `pygame.transform.rotate`, scaling `source` to `size` first
+        """
+        step = round(degrees * self.steps / 360) % self.steps
+        key = source, step, size
+        entries = self.entries
+        facet = entries.pop(key, None)
+        if facet is not None:
+            # Reinserting keeps the dict in least recently used order
+            entries[key] = facet
+            self.hits += 1
+            return facet
+
+        self.misses += 1
+        if size is not None:
+            source = pygame.transform.scale(source, size)
+        facet = entries[key] = pygame.transform.rotate(source, step * 360 / self.steps)
+        self.bytes += facet.get_pitch() * facet.get_height()
+        while self.bytes > self.max_bytes and len(entries) > 1:
+            evicted = entries.pop(next(iter(entries)))
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return facet
+
+    def clear(self) -> None:
+        self.entries = {}
+        self.bytes = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+
+rotations = RotationCache()
+
+
+class ScaleCache:
+    """
+    Process-wide square copies of source surfaces, one per size. They are
+    never evicted: callers with a continuous range of sizes round them with
+    `bucket` first
+    """
+
+    def __init__(self, step: int = SCALE_BUCKET) -> None:
+        self.step = step
+        self.entries: dict[tuple[Surface, int], Surface] = {}
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def bucket(self, size: float) -> int:
+        return max(self.step, round(size / self.step) * self.step)
+
+    def scale(self, source: Surface, size: int) -> Surface:
+        key = source, size
+        facet = self.entries.get(key)
+        if facet is not None:
+            self.hits += 1
+            return facet
+        self.misses += 1
+        facet = self.entries[key] = pygame.transform.scale(source, (size, size))
+        self.bytes += facet.get_pitch() * facet.get_height()
+        return facet
+
+    def warm(self, sources: Iterable[Surface], sizes: Iterable[int]) -> None:
+        """
+        Scale ahead of time, so the first actors of each size are free too
+        """
+        sizes = list(sizes)
+        for source in sources:
+            for size in sizes:
+                if (source, size) not in self.entries:
+                    self.scale(source, size)
+                    self.misses -= 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+
+scales = ScaleCache()
@@ -2,10 +2,13 @@ from random import choice, randint
 from pygame import Surface
 import pygame
 from action import Actor
-from consts import RESOLUTION
+from consts import BACKGROUND, RESOLUTION, STARS_DENSITY
 
 
 class StarsBackground(Actor):
+    __slots__ = ("width", "strips", "speeds", "xs")
+    z: int = -1
+    backdrop: bool = True
     colors = [
         (0xFF, 0xFF, 0xFF),
         (0xFF, 0xD0, 0xD0),
@@ -13,11 +16,10 @@ class StarsBackground(Actor):
         (0xD0, 0xD0, 0xFF),
     ]
 
-    def __init__(self) -> None:
-        self.z = -1
+    def __init__(self, density: float = STARS_DENSITY) -> None:
         width = self.width = RESOLUTION[0]
 
-        facets = self.facets = [
+        facets = [
             Surface(RESOLUTION, pygame.SRCALPHA),
             Surface(RESOLUTION, pygame.SRCALPHA),
             Surface(RESOLUTION, pygame.SRCALPHA),
@@ -25,22 +27,36 @@ class StarsBackground(Actor):
 
         self.speeds: list[float] = [20.0, 40.0, 60.0]
         self.xs: list[float] = [10.0, 0.0, 0.0]
-        rect = (0, 0, *RESOLUTION)
+        shade = Surface(RESOLUTION, pygame.SRCALPHA)
+        shade.fill("#00000080")
 
         for i, facet in enumerate(facets):
-            pygame.draw.rect(facet, "#00000080", rect)
-            for x in range(0, width, 1 << i):
+            for x in range(0, width, max(1, round((1 << i) / density))):
                 y = randint(0, RESOLUTION[1])
                 color = choice(self.colors)
                 pygame.draw.circle(facet, color, (x, y), i + 1)
 
-    async def update(self, delta: float) -> None:
+        # Each layer is flattened on the background with the translucent
+        # fill of the layers above baked in. The bottom one is opaque, the
+        # others only keep their stars, as run-length encoded color keys
+        self.strips: list[Surface] = []
+        for i, facet in enumerate(facets):
+            strip = Surface(RESOLUTION).convert()
+            strip.fill(BACKGROUND)
+            strip.blit(facet, (0, 0))
+            for _ in facets[i + 1 :]:
+                strip.blit(shade, (0, 0))
+            if i:
+                strip.set_colorkey(BACKGROUND, pygame.RLEACCEL)
+            self.strips.append(strip)
+
+    def update(self, delta: float) -> None:
         for i, speed in enumerate(self.speeds):
             self.xs[i] -= speed * delta
             if self.xs[i] < 0:
                 self.xs[i] += self.width
 
-    async def draw(self, surface: Surface) -> None:
-        for i, facet in enumerate(self.facets):
-            surface.blit(facet, (self.xs[i] - self.width, 0))
-            surface.blit(facet, (self.xs[i], 0))
+    def draw(self, surface: Surface) -> None:
+        for i, strip in enumerate(self.strips):
+            surface.blit(strip, (self.xs[i] - self.width, 0))
+            surface.blit(strip, (self.xs[i], 0))
@@ -1,6 +1,33 @@
-from typing import AsyncGenerator, Iterable
+import asyncio
+from types import CoroutineType
+from typing import Any, Iterable, Optional
 
 
-async def async_gen[T](gen: Iterable[T]) -> AsyncGenerator[T]:
-    for element in gen:
-        yield element
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop shared by legacy async actors, created on first use
+    """
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+async def _gather[T](coroutines: Iterable[CoroutineType[Any, Any, T]]) -> list[T]:
+    return await asyncio.gather(*coroutines)
+
+
+def settle[T](results: list[T | CoroutineType[Any, Any, T]]) -> list[T]:
+    """
+    Replace, in place, the coroutines returned by legacy async actors with
+    their results. The event loop is only entered when there is one
+    """
+    pending = [i for i, result in enumerate(results) if type(result) is CoroutineType]
+    if pending:
+        done = event_loop().run_until_complete(_gather(results[i] for i in pending))
+        for i, result in zip(pending, done):
+            results[i] = result
+    return results  # type: ignore